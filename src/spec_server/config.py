@@ -8,6 +8,7 @@ and optional JSON configuration files with validation and defaults.
 import json
 import logging
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional, Union
 
@@ -151,8 +152,7 @@ class ConfigManager:
             return {}
 
         try:
-            with open(config_file, "r") as f:
-                data = json.load(f)
+            data = json.loads(config_file.read_text())
 
             if not isinstance(data, dict):
                 raise ValueError("Configuration file must contain a JSON object")
@@ -307,10 +307,13 @@ class ConfigManager:
         return config
 
 
+@lru_cache(maxsize=1)
 def create_example_config() -> str:
     """
     Create an example configuration file content.
 
+    The content depends only on the ServerConfig defaults, so it is built once.
+
     Returns:
         JSON string with example configuration
     """
@@ -345,14 +348,19 @@ def create_example_config() -> str:
 config_manager = ConfigManager()
 
 
-def get_config() -> ServerConfig:
+def get_config(manager: Optional[ConfigManager] = None) -> ServerConfig:
     """
     Get the global configuration instance.
 
+    Args:
+        manager: Configuration manager to use (None for the global manager)
+
     Returns:
         Current ServerConfig instance
     """
-    return config_manager.get_config()
+    if manager is None:
+        manager = config_manager
+    return manager.get_config()
 
 
 def detect_workspace_root() -> Optional[Path]:
@@ -443,11 +451,16 @@ def get_effective_specs_dir(config: Optional[ServerConfig] = None) -> Path:
     return fallback_dir
 
 
-def reload_config() -> ServerConfig:
+def reload_config(manager: Optional[ConfigManager] = None) -> ServerConfig:
     """
     Reload the global configuration.
 
+    Args:
+        manager: Configuration manager to use (None for the global manager)
+
     Returns:
         Reloaded ServerConfig instance
     """
-    return config_manager.reload_config()
+    if manager is None:
+        manager = config_manager
+    return manager.reload_config()
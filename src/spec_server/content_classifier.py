@@ -3,11 +3,23 @@ Content classification functionality for determining document placement.
 """
 
 import re
-from typing import List
+from typing import List, Optional, Tuple
 
 from .models import ContentBlock
 from .task_formatting_cache import get_cache
 
+# Header and task lines, told apart by the name of the matching group
+_TASK_LINE_PATTERN = r"\s*-\s*\[[\sx-]\]|\s*\d+(?:\.\d+)*\."
+_LINE_PATTERN = re.compile(rf"(?P<header>#)|(?P<task>{_TASK_LINE_PATTERN})")
+_TASK_LINE_RE = re.compile(_TASK_LINE_PATTERN)
+
+# Document that each classified content type belongs in
+_SUGGESTED_LOCATIONS = {
+    "requirement": "requirements",
+    "design": "design",
+    "task": "tasks",
+}
+
 
 class ContentClassifier:
     """
@@ -16,6 +28,7 @@ class ContentClassifier:
 
     def __init__(self) -> None:
         """Initialize the ContentClassifier."""
+        self._profile: Optional[Tuple[Tuple[str, ...], ...]] = None
         self.task_keywords = [
             "implement",
             "create",
@@ -58,11 +71,46 @@ class ContentClassifier:
             "framework",
         ]
 
+    # Assigning a keyword list drops the keyword profile that cached results are keyed on.
+    # Lists changed in place are not noticed, so assign a new list to change the keywords.
+    @property
+    def task_keywords(self) -> List[str]:
+        """Keywords that mark content as a task."""
+        return self._task_keywords
+
+    @task_keywords.setter
+    def task_keywords(self, keywords: List[str]) -> None:
+        self._task_keywords = keywords
+        self._profile = None
+
+    @property
+    def requirement_keywords(self) -> List[str]:
+        """Keywords that mark content as a requirement."""
+        return self._requirement_keywords
+
+    @requirement_keywords.setter
+    def requirement_keywords(self, keywords: List[str]) -> None:
+        self._requirement_keywords = keywords
+        self._profile = None
+
+    @property
+    def design_keywords(self) -> List[str]:
+        """Keywords that mark content as design."""
+        return self._design_keywords
+
+    @design_keywords.setter
+    def design_keywords(self, keywords: List[str]) -> None:
+        self._design_keywords = keywords
+        self._profile = None
+
     def classify_content_blocks(self, content: str) -> List[ContentBlock]:
         """Classify content blocks to determine appropriate document placement."""
-        # Check cache first
+        # Check cache first; results depend on the current keyword lists
         cache = get_cache()
-        cached_blocks = cache.get_classified_content(content)
+        keyword_profile = self._profile
+        if keyword_profile is None:
+            keyword_profile = self._profile = (tuple(self.task_keywords), tuple(self.requirement_keywords), tuple(self.design_keywords))
+        cached_blocks = cache.get_classified_content(content, keyword_profile)
         if cached_blocks is not None:
             return cached_blocks
 
@@ -83,7 +131,8 @@ class ContentClassifier:
                     current_block = []
                 continue
 
-            if self._is_header(line) or self._is_task_line(line):
+            line_match = _LINE_PATTERN.match(line)
+            if line_match:
                 if current_block:
                     block_content = "\n".join(current_block)
                     block = self._classify_block(block_content, current_line_start)
@@ -91,10 +140,9 @@ class ContentClassifier:
                     current_block = []
 
                 # Process header/task as its own block
-                content_type = "header" if self._is_header(line) else "task"
                 block = ContentBlock(
                     content=line,
-                    content_type=content_type,
+                    content_type=line_match.lastgroup or "task",
                     confidence=0.9,
                     suggested_location="tasks",
                     line_number=line_num,
@@ -113,7 +161,7 @@ class ContentClassifier:
             blocks.append(block)
 
         # Cache the result
-        cache.set_classified_content(content, blocks)
+        cache.set_classified_content(content, blocks, keyword_profile)
 
         return blocks
 
@@ -121,24 +169,16 @@ class ContentClassifier:
         """Classify a single content block."""
         content_lower = content.lower()
 
-        task_score = self._calculate_keyword_score(content_lower, self.task_keywords)
-        requirement_score = self._calculate_keyword_score(content_lower, self.requirement_keywords)
-        design_score = self._calculate_keyword_score(content_lower, self.design_keywords)
-
         scores = {
-            "task": task_score,
-            "requirement": requirement_score,
-            "design": design_score,
+            "task": self._calculate_keyword_score(content_lower, self.task_keywords),
+            "requirement": self._calculate_keyword_score(content_lower, self.requirement_keywords),
+            "design": self._calculate_keyword_score(content_lower, self.design_keywords),
         }
 
-        best_type = max(scores, key=lambda x: scores[x])
+        best_type = max(scores, key=scores.__getitem__)
         confidence = scores[best_type]
 
-        suggested_location = {
-            "requirement": "requirements",
-            "design": "design",
-            "task": "tasks",
-        }.get(best_type, "tasks")
+        suggested_location = _SUGGESTED_LOCATIONS.get(best_type, "tasks")
 
         return ContentBlock(
             content=content,
@@ -150,9 +190,11 @@ class ContentClassifier:
 
     def _calculate_keyword_score(self, content: str, keywords: List[str]) -> float:
         """Calculate keyword match score for content."""
-        matches = sum(1 for keyword in keywords if keyword in content)
         if not keywords:
             return 0.0
+        # Substring search runs in C; one ``in`` per keyword beats a combined
+        # regex or a Python-level automaton for keyword lists of this size.
+        matches = sum(keyword in content for keyword in keywords)
         return min(matches / len(keywords), 1.0)
 
     def _is_header(self, line: str) -> bool:
@@ -161,4 +203,4 @@ class ContentClassifier:
 
     def _is_task_line(self, line: str) -> bool:
         """Check if line represents a task."""
-        return bool(re.match(r"^\s*-\s*\[[\sx-]\]\s*", line) or re.match(r"^\s*\d+(?:\.\d+)*\.\s*", line))
+        return _TASK_LINE_RE.match(line) is not None
@@ -7,10 +7,44 @@ while preserving existing content.
 """
 
 import re
+from bisect import bisect_right
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 from .models import DEFAULT_ENHANCED_DESIGN_TEMPLATE, DesignElementTemplate, EnhancedDesignTemplate, TechnicalElement
 
+# A bold section runs until the next bold label, the next heading or the end of the content
+_SECTION_END = r"(?=\n\s*\*\*|\n\s*##|\n\s*###|$)"
+
+# Patterns for extracting the Intent/Goals/Logic sections, keyed by section
+_SECTION_PATTERNS = {name.lower(): re.compile(rf"\*\*{name}\*\*:\s*(.*?){_SECTION_END}", re.DOTALL | re.IGNORECASE) for name in ("Intent", "Goals", "Logic")}
+
+# Patterns for sections that are dropped from the remaining content
+_REMOVED_SECTION_PATTERNS = tuple(re.compile(rf"\*\*{name}\*\*:.*?{_SECTION_END}", re.DOTALL | re.IGNORECASE) for name in ("Intent", "Goals", "Logic", "Purpose", "Objectives", "Implementation"))
+
+# One goal per line; [^\S\n] is whitespace other than a newline
+_GOAL_LINE_PATTERN = re.compile(r"^[^\S\n]*(?:[-*] [^\S\n]*(.*?)|([^-*\s].*?))[^\S\n]*$", re.MULTILINE)
+_HEADER_PATTERN = re.compile(r"^(#{1,6}\s+.*?)$", re.MULTILINE)
+_EXCESS_BLANK_LINES_PATTERN = re.compile(r"\n\s*\n\s*\n+")
+_LEADING_BLANK_LINES_PATTERN = re.compile(r"^\s*\n+")
+
+# Phrases that indicate an element's purpose, responsibilities and implementation
+_PURPOSE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (r"handles?\s+(\w+)", r"manages?\s+(\w+)", r"provides?\s+(\w+)", r"implements?\s+(\w+)", r"processes?\s+(\w+)"))
+_RESPONSIBILITY_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (r"responsible for\s+([^.]+)", r"ensures?\s+([^.]+)", r"maintains?\s+([^.]+)", r"supports?\s+([^.]+)"))
+_IMPLEMENTATION_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (r"uses?\s+([^.]+)", r"implements?\s+([^.]+)", r"follows?\s+([^.]+)", r"applies?\s+([^.]+)"))
+
+
+@lru_cache(maxsize=64)
+def _default_element_template(element_type: str) -> DesignElementTemplate:
+    """Build the fallback template for an element type without one, once per type."""
+    type_label = element_type.replace("_", " ")
+    return DesignElementTemplate(
+        element_type=element_type,
+        intent_template=f"Core functionality provided by this {type_label}",
+        goals_template=f"- Implement {type_label} functionality\n- Maintain system integrity\n- Provide reliable operation",
+        logic_template=f"This {type_label} works by implementing the required functionality and integrating with other system components.",
+    )
+
 
 class DesignElementFormattingError(Exception):
     """Exception raised when design element formatting fails."""
@@ -76,8 +110,10 @@ class DesignElementFormatter:
         Returns:
             Generated Intent section content
         """
-        element_template = self._get_element_template(element_type)
+        return self._generate_intent(self._get_element_template(element_type), element_type, element_name, existing_content)
 
+    def _generate_intent(self, element_template: DesignElementTemplate, element_type: str, element_name: str, existing_content: str) -> str:
+        """Generate Intent section content from an already resolved element template."""
         # Use template to generate intent content
         intent_content = element_template.intent_template.format(element_name=element_name, element_type=element_type)
 
@@ -99,8 +135,10 @@ class DesignElementFormatter:
         Returns:
             List of goal bullet points
         """
-        element_template = self._get_element_template(element_type)
+        return self._generate_goals(self._get_element_template(element_type), element_type, element_name, existing_content)
 
+    def _generate_goals(self, element_template: DesignElementTemplate, element_type: str, element_name: str, existing_content: str) -> List[str]:
+        """Generate Goals section content from an already resolved element template."""
         # Use template to generate goals content
         goals_content = element_template.goals_template.format(element_name=element_name, element_type=element_type)
 
@@ -125,8 +163,10 @@ class DesignElementFormatter:
         Returns:
             Generated Logic section content
         """
-        element_template = self._get_element_template(element_type)
+        return self._generate_logic(self._get_element_template(element_type), element_type, element_name, existing_content)
 
+    def _generate_logic(self, element_template: DesignElementTemplate, element_type: str, element_name: str, existing_content: str) -> str:
+        """Generate Logic section content from an already resolved element template."""
         # Use template to generate logic content
         logic_content = element_template.logic_template.format(element_name=element_name, element_type=element_type)
 
@@ -142,36 +182,16 @@ class DesignElementFormatter:
             return self.template.format_templates[element_type]
 
         # Return a default template if specific type not found
-        return DesignElementTemplate(
-            element_type=element_type,
-            intent_template=f"Core functionality provided by this {element_type.replace('_', ' ')}",
-            goals_template=f"- Implement {element_type.replace('_', ' ')} functionality\n- Maintain system integrity\n- Provide reliable operation",
-            logic_template=f"This {element_type.replace('_', ' ')} works by implementing the required functionality and integrating with other system components.",
-        )
+        return _default_element_template(element_type)
 
     def _extract_existing_sections(self, content: str) -> Dict[str, str]:
         """Extract existing Intent/Goals/Logic sections from content."""
         sections = {"intent": "", "goals": "", "logic": "", "other": content}  # Store original content as fallback
 
-        # Patterns for extracting sections
-        intent_pattern = r"\*\*Intent\*\*:\s*(.*?)(?=\n\s*\*\*|\n\s*##|\n\s*###|$)"
-        goals_pattern = r"\*\*Goals\*\*:\s*(.*?)(?=\n\s*\*\*|\n\s*##|\n\s*###|$)"
-        logic_pattern = r"\*\*Logic\*\*:\s*(.*?)(?=\n\s*\*\*|\n\s*##|\n\s*###|$)"
-
-        # Extract Intent section
-        intent_match = re.search(intent_pattern, content, re.DOTALL | re.IGNORECASE)
-        if intent_match:
-            sections["intent"] = intent_match.group(1).strip()
-
-        # Extract Goals section
-        goals_match = re.search(goals_pattern, content, re.DOTALL | re.IGNORECASE)
-        if goals_match:
-            sections["goals"] = goals_match.group(1).strip()
-
-        # Extract Logic section
-        logic_match = re.search(logic_pattern, content, re.DOTALL | re.IGNORECASE)
-        if logic_match:
-            sections["logic"] = logic_match.group(1).strip()
+        for section, pattern in _SECTION_PATTERNS.items():
+            match = pattern.search(content)
+            if match:
+                sections[section] = match.group(1).strip()
 
         return sections
 
@@ -180,7 +200,7 @@ class DesignElementFormatter:
         lines = []
 
         # Start with element header (preserve original header format)
-        header_match = re.search(r"^(#{1,6}\s+.*?)$", element.content, re.MULTILINE)
+        header_match = _HEADER_PATTERN.search(element.content)
         if header_match:
             lines.append(header_match.group(1))
         else:
@@ -192,7 +212,7 @@ class DesignElementFormatter:
         # Add Intent section
         intent_content = existing_sections.get("intent")
         if not intent_content:
-            intent_content = self.generate_intent_section(element.element_type, element.element_name, element.content)
+            intent_content = self._generate_intent(template, element.element_type, element.element_name, element.content)
 
         section_names = template.section_names
         lines.append(f"**{section_names.get('intent', 'Intent')}**: {intent_content}")
@@ -201,7 +221,7 @@ class DesignElementFormatter:
         # Add Goals section
         goals_content = existing_sections.get("goals")
         if not goals_content:
-            goals_list = self.generate_goals_section(element.element_type, element.element_name, element.content)
+            goals_list = self._generate_goals(template, element.element_type, element.element_name, element.content)
             goals_content = "\n".join(f"- {goal}" for goal in goals_list)
 
         lines.append(f"**{section_names.get('goals', 'Goals')}**:")
@@ -214,7 +234,7 @@ class DesignElementFormatter:
         # Add Logic section
         logic_content = existing_sections.get("logic")
         if not logic_content:
-            logic_content = self.generate_logic_section(element.element_type, element.element_name, element.content)
+            logic_content = self._generate_logic(template, element.element_type, element.element_name, element.content)
 
         lines.append(f"**{section_names.get('logic', 'Logic')}**: {logic_content}")
 
@@ -229,10 +249,8 @@ class DesignElementFormatter:
     def _enhance_intent_with_context(self, intent_content: str, existing_content: str, element_type: str) -> str:
         """Enhance intent content using context from existing content."""
         # Look for key phrases that might indicate the element's purpose
-        purpose_indicators = [r"handles?\s+(\w+)", r"manages?\s+(\w+)", r"provides?\s+(\w+)", r"implements?\s+(\w+)", r"processes?\s+(\w+)"]
-
-        for pattern in purpose_indicators:
-            match = re.search(pattern, existing_content, re.IGNORECASE)
+        for pattern in _PURPOSE_PATTERNS:
+            match = pattern.search(existing_content)
             if match:
                 purpose = match.group(1)
                 # Enhance the template with specific purpose
@@ -245,12 +263,10 @@ class DesignElementFormatter:
     def _enhance_goals_with_context(self, goals_list: List[str], existing_content: str, element_type: str) -> List[str]:
         """Enhance goals list using context from existing content."""
         # Look for specific responsibilities mentioned in the content
-        responsibility_patterns = [r"responsible for\s+([^.]+)", r"ensures?\s+([^.]+)", r"maintains?\s+([^.]+)", r"supports?\s+([^.]+)"]
-
         enhanced_goals = goals_list.copy()
 
-        for pattern in responsibility_patterns:
-            matches = re.findall(pattern, existing_content, re.IGNORECASE)
+        for pattern in _RESPONSIBILITY_PATTERNS:
+            matches = pattern.findall(existing_content)
             for match in matches:
                 responsibility = match.strip()
                 if responsibility and len(responsibility) < 100:  # Avoid overly long matches
@@ -263,11 +279,9 @@ class DesignElementFormatter:
     def _enhance_logic_with_context(self, logic_content: str, existing_content: str, element_type: str) -> str:
         """Enhance logic content using context from existing content."""
         # Look for implementation details or technical approaches
-        implementation_patterns = [r"uses?\s+([^.]+)", r"implements?\s+([^.]+)", r"follows?\s+([^.]+)", r"applies?\s+([^.]+)"]
-
         implementation_details = []
-        for pattern in implementation_patterns:
-            matches = re.findall(pattern, existing_content, re.IGNORECASE)
+        for pattern in _IMPLEMENTATION_PATTERNS:
+            matches = pattern.findall(existing_content)
             for match in matches:
                 detail = match.strip()
                 if detail and len(detail) < 100:  # Avoid overly long matches
@@ -288,44 +302,41 @@ class DesignElementFormatter:
         if not goals_content:
             return []
 
-        # Split by newlines and extract bullet points
-        lines = goals_content.split("\n")
-        goals = []
-
-        for line in lines:
-            line = line.strip()
-            if line.startswith("- "):
-                goals.append(line[2:].strip())
-            elif line.startswith("* "):
-                goals.append(line[2:].strip())
-            elif line and not line.startswith("-") and not line.startswith("*"):
-                # If it's not a bullet point but has content, treat as a single goal
-                goals.append(line)
-
-        return [goal for goal in goals if goal]  # Filter out empty goals
+        # Bullet items ("- " or "* ") and plain lines are goals; other lines starting with - or * are not
+        return [bullet or plain for bullet, plain in _GOAL_LINE_PATTERN.findall(goals_content) if bullet or plain]
 
     def _extract_remaining_content(self, original_content: str, existing_sections: Dict[str, str]) -> str:
         """Extract content that wasn't part of the structured sections."""
-        # Remove the header
-        content_without_header = re.sub(r"^#{1,6}\s+.*?$", "", original_content, flags=re.MULTILINE)
-
-        # Remove existing Intent/Goals/Logic sections more precisely
-        patterns_to_remove = [
-            r"\*\*Intent\*\*:.*?(?=\n\s*\*\*|\n\s*##|\n\s*###|$)",
-            r"\*\*Goals\*\*:.*?(?=\n\s*\*\*|\n\s*##|\n\s*###|$)",
-            r"\*\*Logic\*\*:.*?(?=\n\s*\*\*|\n\s*##|\n\s*###|$)",
-            r"\*\*Purpose\*\*:.*?(?=\n\s*\*\*|\n\s*##|\n\s*###|$)",
-            r"\*\*Objectives\*\*:.*?(?=\n\s*\*\*|\n\s*##|\n\s*###|$)",
-            r"\*\*Implementation\*\*:.*?(?=\n\s*\*\*|\n\s*##|\n\s*###|$)",
-        ]
-
-        remaining_content = content_without_header
-        for pattern in patterns_to_remove:
-            remaining_content = re.sub(pattern, "", remaining_content, flags=re.DOTALL | re.IGNORECASE)
+        # Collect the spans of headers and structured sections, then keep the
+        # text between them in a single pass over the original content
+        header_spans = [match.span() for match in _HEADER_PATTERN.finditer(original_content)]
+        header_starts = [start for start, _ in header_spans]
+        spans = list(header_spans)
+        for pattern in _REMOVED_SECTION_PATTERNS:
+            position = 0
+            while match := pattern.search(original_content, position):
+                # A label on a header line goes with the header; resume after
+                # it so the section does not swallow the text that follows
+                index = bisect_right(header_starts, match.start()) - 1
+                if index >= 0 and match.start() < header_spans[index][1]:
+                    position = header_spans[index][1]
+                    continue
+                spans.append(match.span())
+                position = max(match.end(), match.start() + 1)
+        spans.sort()
+
+        parts = []
+        position = 0
+        for start, end in spans:
+            if start > position:
+                parts.append(original_content[position:start])
+            position = max(position, end)
+        parts.append(original_content[position:])
+        remaining_content = "".join(parts)
 
         # Clean up extra whitespace
-        remaining_content = re.sub(r"\n\s*\n\s*\n+", "\n\n", remaining_content)
-        remaining_content = re.sub(r"^\s*\n+", "", remaining_content)
+        remaining_content = _EXCESS_BLANK_LINES_PATTERN.sub("\n\n", remaining_content)
+        remaining_content = _LEADING_BLANK_LINES_PATTERN.sub("", remaining_content)
 
         return remaining_content.strip()
 
@@ -329,23 +329,36 @@ class SpecManager:
             feature_name: Kebab-case identifier for the feature
             **updates: Metadata fields to update
         """
-        spec_dir = self._get_spec_directory(feature_name)
+        self.update_specs_metadata({feature_name: updates})
 
-        if not spec_dir.exists():
-            raise SpecError(
-                f"Specification '{feature_name}' not found",
-                error_code=ErrorCode.SPEC_NOT_FOUND,
-                details={"feature_name": feature_name},
-            )
+    def update_specs_metadata(self, updates_by_feature: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Update metadata for several specifications with a single registry write.
+
+        Args:
+            updates_by_feature: Metadata fields to update, keyed by feature name
+
+        Raises:
+            SpecError: If any of the specifications does not exist (nothing is written)
+        """
+        for feature_name in updates_by_feature:
+            if not self._get_spec_directory(feature_name).exists():
+                raise SpecError(
+                    f"Specification '{feature_name}' not found",
+                    error_code=ErrorCode.SPEC_NOT_FOUND,
+                    details={"feature_name": feature_name},
+                )
 
         registry = self._load_metadata_registry()
+        updated_at = datetime.now().isoformat()
 
-        if feature_name not in registry:
-            registry[feature_name] = {}
+        for feature_name, updates in updates_by_feature.items():
+            if feature_name not in registry:
+                registry[feature_name] = {}
 
-        # Update metadata
-        registry[feature_name].update(updates)
-        registry[feature_name]["updated_at"] = datetime.now().isoformat()
+            # Update metadata
+            registry[feature_name].update(updates)
+            registry[feature_name]["updated_at"] = updated_at
 
         self._save_metadata_registry(registry)
 
@@ -6,7 +6,7 @@ import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from threading import Lock
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .task_formatting_config import get_config
 
@@ -205,12 +205,12 @@ class TaskFormattingCache:
         self.stats["sets"] += 1
         self.logger.debug(f"Cached parsed tasks: {key}")
 
-    def get_classified_content(self, content: str) -> Optional[List[Any]]:
-        """Get cached content classification."""
+    def get_classified_content(self, content: str, keyword_profile: Tuple[Tuple[str, ...], ...] = ()) -> Optional[List[Any]]:
+        """Get cached content classification for a classifier keyword profile."""
         if not self.config.enable_caching:
             return None
 
-        key = self._generate_key("classified_content", content)
+        key = self._generate_key("classified_content", content, repr(keyword_profile))
         entry = self.backend.get(key)
 
         if entry is not None:
@@ -221,12 +221,12 @@ class TaskFormattingCache:
         self.stats["misses"] += 1
         return None
 
-    def set_classified_content(self, content: str, blocks: List) -> None:
-        """Cache content classification."""
+    def set_classified_content(self, content: str, blocks: List, keyword_profile: Tuple[Tuple[str, ...], ...] = ()) -> None:
+        """Cache content classification for a classifier keyword profile."""
         if not self.config.enable_caching:
             return
 
-        key = self._generate_key("classified_content", content)
+        key = self._generate_key("classified_content", content, repr(keyword_profile))
         ttl = self.config.cache_ttl_seconds
 
         self.backend.set(key, blocks, ttl)
@@ -5,7 +5,17 @@ import traceback
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
+
+_CONTENT_PREVIEW_LENGTH = 200
+
+
+def _content_preview(content: Optional[str]) -> str:
+    """Return the leading slice of content for error details, avoiding a copy when it is already short."""
+    if not content:
+        return ""
+    return content if len(content) <= _CONTENT_PREVIEW_LENGTH else content[:_CONTENT_PREVIEW_LENGTH]
 
 
 class TaskFormattingErrorCode(Enum):
@@ -142,7 +152,12 @@ class TaskFormattingErrorHandler:
         recoverable: bool = True,
         suggested_action: Optional[str] = None,
     ) -> TaskFormattingError:
-        """Handle and log an error."""
+        """Handle and log an error.
+
+        Tracebacks are only captured for non-recoverable errors, or when the
+        logger is at DEBUG level, to keep the error history cheap.
+        """
+        capture_traceback = exception is not None and (not recoverable or self.logger.isEnabledFor(logging.DEBUG))
 
         error = TaskFormattingError(
             error_code=error_code,
@@ -151,7 +166,7 @@ class TaskFormattingErrorHandler:
             context=context or {},
             recoverable=recoverable,
             suggested_action=suggested_action,
-            traceback_info=traceback.format_exc() if exception else None,
+            traceback_info=traceback.format_exc() if capture_traceback else None,
         )
 
         # Log the error
@@ -185,7 +200,7 @@ class TaskFormattingErrorHandler:
             message=message,
             exception=exception,
             context={"content_length": len(content), "line_number": line_number},
-            details={"content_preview": content[:200] if content else ""},
+            details={"content_preview": _content_preview(content)},
             suggested_action="Check task format and syntax",
         )
 
@@ -202,7 +217,7 @@ class TaskFormattingErrorHandler:
             message=message,
             exception=exception,
             context={"content_length": len(content), "confidence": confidence},
-            details={"content_preview": content[:200] if content else ""},
+            details={"content_preview": _content_preview(content)},
             suggested_action="Review content classification thresholds",
         )
 
@@ -331,6 +346,7 @@ class TaskFormattingMetrics:
             "last_reset": datetime.now().isoformat(),
         }
         self.processing_times: List[float] = []
+        self._view: Mapping[str, Any] = MappingProxyType(self.metrics)
 
     def record_operation(
         self,
@@ -365,9 +381,12 @@ class TaskFormattingMetrics:
         if self.processing_times:
             self.metrics["average_processing_time"] = sum(self.processing_times) / len(self.processing_times)
 
-    def get_metrics(self) -> Dict[str, Any]:
-        """Get current metrics."""
-        return self.metrics.copy()
+    def get_metrics(self) -> Mapping[str, Any]:
+        """Get a read-only live view of current metrics.
+
+        Use ``dict(get_metrics())`` when a point-in-time snapshot is needed.
+        """
+        return self._view
 
     def reset_metrics(self) -> None:
         """Reset all metrics."""
@@ -378,6 +397,7 @@ class TaskFormattingMetrics:
             "recovery_attempts": 0,
             "successful_recoveries": 0,
         }
+        self._view = MappingProxyType(self.metrics)
 
 
 # Global error handler and metrics instances
@@ -3,10 +3,20 @@ Task rendering functionality for converting TaskItem objects back to markdown.
 """
 
 import re
-from typing import List, Optional
+from collections import Counter
+from typing import Any, Dict, List, Optional
 
 from .models import ContentBlock, TaskItem, TaskStatus
 
+# Status symbols keyed by both the enum member and its value, since TaskItem
+# stores statuses as plain values (use_enum_values=True)
+_STATUS_SYMBOLS: Dict[Any, str] = {
+    TaskStatus.NOT_STARTED: "[ ]",
+    TaskStatus.IN_PROGRESS: "[-]",
+    TaskStatus.COMPLETED: "[x]",
+}
+_STATUS_SYMBOLS.update({status.value: symbol for status, symbol in list(_STATUS_SYMBOLS.items())})
+
 
 class TaskRenderer:
     """
@@ -19,11 +29,7 @@ class TaskRenderer:
     def __init__(self) -> None:
         """Initialize the TaskRenderer."""
         # Status symbols mapping
-        self.status_symbols = {
-            "not_started": "[ ]",
-            "in_progress": "[-]",
-            "completed": "[x]",
-        }
+        self.status_symbols = _STATUS_SYMBOLS
 
     def render_tasks(self, tasks: List[TaskItem], preserve_content: Optional[List[ContentBlock]] = None) -> str:
         """
@@ -144,8 +150,7 @@ class TaskRenderer:
             Formatted markdown string for the task
         """
         # Get status symbol
-        status_key = task.status.value if hasattr(task.status, "value") else str(task.status)
-        status_symbol = self.status_symbols.get(status_key, "[ ]")
+        status_symbol = self.status_symbols.get(task.status, "[ ]")
 
         # Calculate hierarchy level and indentation
         hierarchy_level = self._calculate_hierarchy_level(task.identifier)
@@ -180,9 +185,10 @@ class TaskRenderer:
             return "No tasks defined."
 
         total = len(tasks)
-        completed = sum(1 for task in tasks if task.status == "completed")
-        in_progress = sum(1 for task in tasks if task.status == "in_progress")
-        not_started = sum(1 for task in tasks if task.status == "not_started")
+        status_counts: Counter[Any] = Counter(task.status for task in tasks)
+        completed = status_counts["completed"]
+        in_progress = status_counts["in_progress"]
+        not_started = status_counts["not_started"]
 
         completion_rate = (completed / total) * 100 if total > 0 else 0
 
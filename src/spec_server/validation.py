@@ -5,22 +5,43 @@ This module provides comprehensive validation for all MCP tool parameters,
 including file path sanitization and security checks.
 """
 
+import os
 import re
-from pathlib import Path
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
-from pydantic import BaseModel, Field
+from .errors import ErrorFactory, SpecError
 
-from .errors import ErrorFactory
+# Error constructors bound once for the parameter validation path
+_invalid_spec_name = ErrorFactory.invalid_spec_name
+_validation_error = ErrorFactory.validation_error
 
 
-class ValidationResult(BaseModel):
+@dataclass(frozen=True, slots=True)
+class ValidationResult:
     """Result of a validation operation."""
 
     is_valid: bool
     sanitized_value: Any = None
-    errors: List[str] = Field(default_factory=list)
-    warnings: List[str] = Field(default_factory=list)
+    errors: Sequence[str] = ()
+    warnings: Sequence[str] = ()
+
+    def model_dump(self) -> Dict[str, Any]:
+        """Return the result as a dictionary, matching the former pydantic model API."""
+        return {
+            "is_valid": self.is_valid,
+            "sanitized_value": self.sanitized_value,
+            "errors": list(self.errors),
+            "warnings": list(self.warnings),
+        }
+
+
+# Shared results for inputs that always validate the same way
+_VALID_NONE = ValidationResult(is_valid=True, sanitized_value=None)
+_VALID_TRUE = ValidationResult(is_valid=True, sanitized_value=True)
+_VALID_FALSE = ValidationResult(is_valid=True, sanitized_value=False)
 
 
 class InputValidator:
@@ -29,8 +50,32 @@ class InputValidator:
     # Valid feature name pattern (kebab-case)
     FEATURE_NAME_PATTERN = re.compile(r"^[a-z][a-z0-9]*(-[a-z0-9]+)*$")
 
+    # Same pattern allowing surrounding whitespace, capturing the stripped name
+    _PADDED_FEATURE_NAME_PATTERN = re.compile(r"\s*([a-z][a-z0-9]*(?:-[a-z0-9]+)*)\s*\Z")
+
     # Valid document types
-    VALID_DOCUMENT_TYPES = {"requirements", "design", "tasks"}
+    VALID_DOCUMENT_TYPES = frozenset({"requirements", "design", "tasks"})
+
+    # Feature names that are allowed but warned about
+    RESERVED_FEATURE_NAMES = frozenset({"test", "spec", "server", "admin", "root", "config"})
+
+    # File extensions that are allowed but warned about
+    SUSPICIOUS_EXTENSIONS = frozenset({".exe", ".bat", ".cmd", ".sh", ".ps1", ".vbs", ".js"})
+
+    # Accepted string forms of boolean values
+    BOOLEAN_STRINGS = MappingProxyType(
+        {
+            "true": True,
+            "1": True,
+            "yes": True,
+            "on": True,
+            "false": False,
+            "0": False,
+            "no": False,
+            "off": False,
+            "": False,
+        }
+    )
 
     # Maximum lengths for various inputs
     MAX_FEATURE_NAME_LENGTH = 50
@@ -51,6 +96,23 @@ class InputValidator:
         r"\|",  # Pipes
         r"&",  # Background processes
     ]
+    # Single alternation over all path patterns; match.lastindex identifies which one hit
+    _DANGEROUS_PATH_REGEX = re.compile("|".join(f"({pattern})" for pattern in DANGEROUS_PATH_PATTERNS))
+
+    # Potentially dangerous document content patterns to warn about
+    DANGEROUS_CONTENT_PATTERNS = [
+        r"<script[^>]*>",  # Script tags
+        r"javascript:",  # JavaScript URLs
+        r"data:text/html",  # Data URLs with HTML
+        r"vbscript:",  # VBScript URLs
+    ]
+    # Lowercase literal each content pattern starts with; content is screened for these with
+    # substring search on a lowered copy, and only non-literal patterns fall back to a regex
+    _DANGEROUS_CONTENT_TRIGGERS = ["<script", "javascript:", "data:text/html", "vbscript:"]
+    _DANGEROUS_CONTENT_SCREENS = [(pattern, trigger, re.compile(pattern) if pattern != trigger else None) for pattern, trigger in zip(DANGEROUS_CONTENT_PATTERNS, _DANGEROUS_CONTENT_TRIGGERS)]
+
+    # CRLF and lone CR line endings
+    _LINE_ENDING_PATTERN = re.compile(r"\r\n?")
 
     @classmethod
     def validate_feature_name(cls, feature_name: str) -> ValidationResult:
@@ -63,42 +125,42 @@ class InputValidator:
         Returns:
             ValidationResult with validation status and sanitized value
         """
-        errors = []
-        warnings = []
-
         # Check if feature_name is provided
         if not feature_name:
-            errors.append("Feature name is required")
-            return ValidationResult(is_valid=False, errors=errors)
+            return ValidationResult(is_valid=False, errors=["Feature name is required"])
 
         # Check type
         if not isinstance(feature_name, str):
-            errors.append("Feature name must be a string")
-            return ValidationResult(is_valid=False, errors=errors)
+            return ValidationResult(is_valid=False, errors=["Feature name must be a string"])
 
-        # Check format first (before sanitization to catch case issues)
-        if not cls.FEATURE_NAME_PATTERN.match(feature_name.strip()):
-            errors.append("Feature name must be in kebab-case format (lowercase letters, numbers, and hyphens only). " "Examples: 'user-auth', 'data-export', 'api-v2'")
+        return cls._validate_feature_name_str(feature_name)
 
-        # Sanitize: strip whitespace and convert to lowercase
-        sanitized = feature_name.strip().lower()
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _validate_feature_name_str(cls, feature_name: str) -> ValidationResult:
+        """Validate a non-empty feature name string; cached since clients repeat the same names."""
+        # Check format and strip whitespace in one scan; a valid name is already lowercase
+        errors: List[str] = []
+        match = cls._PADDED_FEATURE_NAME_PATTERN.match(feature_name)
+        if match:
+            sanitized = match.group(1)
+        else:
+            errors.append("Feature name must be in kebab-case format (lowercase letters, numbers, and hyphens only). " "Examples: 'user-auth', 'data-export', 'api-v2'")
+            sanitized = feature_name.strip().lower()
 
         # Check length
         if len(sanitized) > cls.MAX_FEATURE_NAME_LENGTH:
             errors.append(f"Feature name too long (max {cls.MAX_FEATURE_NAME_LENGTH} characters)")
 
         # Check for reserved names
-        reserved_names = {"test", "spec", "server", "admin", "root", "config"}
-        if sanitized in reserved_names:
-            warnings.append(f"'{sanitized}' is a reserved name, consider using a more specific name")
-
-        is_valid = len(errors) == 0
-        return ValidationResult(
-            is_valid=is_valid,
-            sanitized_value=sanitized if is_valid else None,
-            errors=errors,
-            warnings=warnings,
-        )
+        warnings: Sequence[str] = ()
+        if sanitized in cls.RESERVED_FEATURE_NAMES:
+            warnings = (f"'{sanitized}' is a reserved name, consider using a more specific name",)
+
+        # Results are shared through the cache, so store errors as a tuple
+        if errors:
+            return ValidationResult(is_valid=False, errors=tuple(errors), warnings=warnings)
+        return ValidationResult(is_valid=True, sanitized_value=sanitized, warnings=warnings)
 
     @classmethod
     def validate_document_type(cls, document_type: str) -> ValidationResult:
@@ -111,27 +173,27 @@ class InputValidator:
         Returns:
             ValidationResult with validation status
         """
-        errors = []
-
         if not document_type:
-            errors.append("Document type is required")
-            return ValidationResult(is_valid=False, errors=errors)
+            return ValidationResult(is_valid=False, errors=["Document type is required"])
 
         if not isinstance(document_type, str):
-            errors.append("Document type must be a string")
-            return ValidationResult(is_valid=False, errors=errors)
+            return ValidationResult(is_valid=False, errors=["Document type must be a string"])
+
+        return cls._validate_document_type_str(document_type)
 
+    @classmethod
+    @lru_cache(maxsize=128)
+    def _validate_document_type_str(cls, document_type: str) -> ValidationResult:
+        """Validate a non-empty document type string; cached since only a few values are ever sent."""
         sanitized = document_type.strip().lower()
 
         if sanitized not in cls.VALID_DOCUMENT_TYPES:
-            errors.append(f"Invalid document type '{document_type}'. " f"Valid types: {', '.join(sorted(cls.VALID_DOCUMENT_TYPES))}")
+            return ValidationResult(
+                is_valid=False,
+                errors=(f"Invalid document type '{document_type}'. " f"Valid types: {', '.join(sorted(cls.VALID_DOCUMENT_TYPES))}",),
+            )
 
-        is_valid = len(errors) == 0
-        return ValidationResult(
-            is_valid=is_valid,
-            sanitized_value=sanitized if is_valid else None,
-            errors=errors,
-        )
+        return ValidationResult(is_valid=True, sanitized_value=sanitized)
 
     @classmethod
     def validate_document_content(cls, content: str) -> ValidationResult:
@@ -144,39 +206,28 @@ class InputValidator:
         Returns:
             ValidationResult with validation status
         """
-        errors = []
-        warnings = []
-
         if not isinstance(content, str):
-            errors.append("Document content must be a string")
-            return ValidationResult(is_valid=False, errors=errors)
+            return ValidationResult(is_valid=False, errors=["Document content must be a string"])
 
-        # Check length
+        # Check length before scanning oversized content
         if len(content) > cls.MAX_DOCUMENT_CONTENT_LENGTH:
-            errors.append(f"Document content too large (max {cls.MAX_DOCUMENT_CONTENT_LENGTH} characters)")
-
-        # Check for potentially dangerous content
-        dangerous_patterns = [
-            r"<script[^>]*>",  # Script tags
-            r"javascript:",  # JavaScript URLs
-            r"data:text/html",  # Data URLs with HTML
-            r"vbscript:",  # VBScript URLs
-        ]
-
-        for pattern in dangerous_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
-                warnings.append(f"Content contains potentially dangerous pattern: {pattern}")
-
-        # Sanitize: normalize line endings
-        sanitized = content.replace("\r\n", "\n").replace("\r", "\n")
-
-        is_valid = len(errors) == 0
-        return ValidationResult(
-            is_valid=is_valid,
-            sanitized_value=sanitized if is_valid else None,
-            errors=errors,
-            warnings=warnings,
-        )
+            return ValidationResult(is_valid=False, errors=[f"Document content too large (max {cls.MAX_DOCUMENT_CONTENT_LENGTH} characters)"])
+
+        # Check for potentially dangerous content; every pattern contains "<" or ":"
+        warnings: Sequence[str] = ()
+        if "<" in content or ":" in content:
+            # Avoid copying content that is already lowercase
+            lowered = content if content.islower() else content.lower()
+            warnings = [
+                f"Content contains potentially dangerous pattern: {pattern}"
+                for pattern, trigger, regex in cls._DANGEROUS_CONTENT_SCREENS
+                if trigger in lowered and (regex is None or regex.search(lowered))
+            ]
+
+        # Sanitize: normalize line endings in one pass, skipping content that has none to fix
+        sanitized = cls._LINE_ENDING_PATTERN.sub("\n", content) if "\r" in content else content
+
+        return ValidationResult(is_valid=True, sanitized_value=sanitized, warnings=warnings)
 
     @classmethod
     def validate_initial_idea(cls, idea: str) -> ValidationResult:
@@ -189,30 +240,21 @@ class InputValidator:
         Returns:
             ValidationResult with validation status
         """
-        errors = []
-
         if not idea:
-            errors.append("Initial idea is required")
-            return ValidationResult(is_valid=False, errors=errors)
+            return ValidationResult(is_valid=False, errors=["Initial idea is required"])
 
         if not isinstance(idea, str):
-            errors.append("Initial idea must be a string")
-            return ValidationResult(is_valid=False, errors=errors)
+            return ValidationResult(is_valid=False, errors=["Initial idea must be a string"])
 
         sanitized = idea.strip()
 
         if len(sanitized) < 10:
-            errors.append("Initial idea too short (minimum 10 characters)")
+            return ValidationResult(is_valid=False, errors=["Initial idea too short (minimum 10 characters)"])
 
         if len(sanitized) > cls.MAX_IDEA_LENGTH:
-            errors.append(f"Initial idea too long (max {cls.MAX_IDEA_LENGTH} characters)")
+            return ValidationResult(is_valid=False, errors=[f"Initial idea too long (max {cls.MAX_IDEA_LENGTH} characters)"])
 
-        is_valid = len(errors) == 0
-        return ValidationResult(
-            is_valid=is_valid,
-            sanitized_value=sanitized if is_valid else None,
-            errors=errors,
-        )
+        return ValidationResult(is_valid=True, sanitized_value=sanitized)
 
     @classmethod
     def validate_task_identifier(cls, task_id: Optional[str]) -> ValidationResult:
@@ -225,35 +267,30 @@ class InputValidator:
         Returns:
             ValidationResult with validation status
         """
-        errors = []
-
         # None is valid (means get next task)
         if task_id is None:
-            return ValidationResult(is_valid=True, sanitized_value=None)
+            return _VALID_NONE
 
         if not isinstance(task_id, str):
-            errors.append("Task identifier must be a string")
-            return ValidationResult(is_valid=False, errors=errors)
+            return ValidationResult(is_valid=False, errors=["Task identifier must be a string"])
 
         sanitized = task_id.strip()
 
         if not sanitized:
-            errors.append("Task identifier cannot be empty")
-            return ValidationResult(is_valid=False, errors=errors)
+            return ValidationResult(is_valid=False, errors=["Task identifier cannot be empty"])
+
+        errors: List[str] = []
 
         if len(sanitized) > cls.MAX_TASK_IDENTIFIER_LENGTH:
             errors.append(f"Task identifier too long (max {cls.MAX_TASK_IDENTIFIER_LENGTH} characters)")
 
-        # Validate format (should be like "1", "1.2", "2.3.1", etc.)
-        if not re.match(r"^\d+(\.\d+)*$", sanitized):
+        # Validate format (should be like "1", "1.2", "2.3.1", etc.); empty parts reject stray dots
+        if not all(part.isdecimal() for part in sanitized.split(".")):
             errors.append("Task identifier must be in format like '1', '1.2', '2.3.1', etc.")
 
-        is_valid = len(errors) == 0
-        return ValidationResult(
-            is_valid=is_valid,
-            sanitized_value=sanitized if is_valid else None,
-            errors=errors,
-        )
+        if errors:
+            return ValidationResult(is_valid=False, errors=errors)
+        return ValidationResult(is_valid=True, sanitized_value=sanitized)
 
     @classmethod
     def validate_file_path(cls, file_path: str, allow_absolute: bool = False) -> ValidationResult:
@@ -267,46 +304,36 @@ class InputValidator:
         Returns:
             ValidationResult with validation status and sanitized path
         """
-        errors = []
-        warnings = []
-
         if not file_path:
-            errors.append("File path is required")
-            return ValidationResult(is_valid=False, errors=errors)
+            return ValidationResult(is_valid=False, errors=["File path is required"])
 
         if not isinstance(file_path, str):
-            errors.append("File path must be a string")
-            return ValidationResult(is_valid=False, errors=errors)
+            return ValidationResult(is_valid=False, errors=["File path must be a string"])
 
-        # Check for dangerous patterns
-        for pattern in cls.DANGEROUS_PATH_PATTERNS:
-            if re.search(pattern, file_path):
-                errors.append(f"File path contains dangerous pattern: {pattern}")
+        # Check for dangerous patterns in a single scan
+        matched = {match.lastindex for match in cls._DANGEROUS_PATH_REGEX.finditer(file_path) if match.lastindex}
+        errors = [f"File path contains dangerous pattern: {cls.DANGEROUS_PATH_PATTERNS[index - 1]}" for index in sorted(matched)]
 
         # Normalize path without resolving to absolute
         try:
-            path = Path(file_path)
-            sanitized = str(path)
-        except Exception as e:
+            sanitized = os.path.normpath(file_path)
+        except (TypeError, ValueError) as e:
             errors.append(f"Invalid file path: {e}")
             return ValidationResult(is_valid=False, errors=errors)
 
         # Check if absolute path is allowed
-        if path.is_absolute() and not allow_absolute:
+        if os.path.isabs(sanitized) and not allow_absolute:
             errors.append("Absolute paths are not allowed for security reasons")
 
         # Check for suspicious extensions
-        suspicious_extensions = {".exe", ".bat", ".cmd", ".sh", ".ps1", ".vbs", ".js"}
-        if path.suffix.lower() in suspicious_extensions:
-            warnings.append(f"File has potentially dangerous extension: {path.suffix}")
-
-        is_valid = len(errors) == 0
-        return ValidationResult(
-            is_valid=is_valid,
-            sanitized_value=sanitized if is_valid else None,
-            errors=errors,
-            warnings=warnings,
-        )
+        warnings: Sequence[str] = ()
+        suffix = os.path.splitext(sanitized)[1]
+        if suffix.lower() in cls.SUSPICIOUS_EXTENSIONS:
+            warnings = [f"File has potentially dangerous extension: {suffix}"]
+
+        if errors:
+            return ValidationResult(is_valid=False, errors=errors, warnings=warnings)
+        return ValidationResult(is_valid=True, sanitized_value=sanitized, warnings=warnings)
 
     @classmethod
     def validate_boolean(cls, value: Any, field_name: str) -> ValidationResult:
@@ -320,29 +347,72 @@ class InputValidator:
         Returns:
             ValidationResult with validation status
         """
-        errors = []
+        # Literal booleans are by far the most common input
+        if value is True:
+            return _VALID_TRUE
 
-        if value is None:
-            # None is often acceptable for optional boolean fields
-            return ValidationResult(is_valid=True, sanitized_value=False)
+        # None is often acceptable for optional boolean fields
+        if value is False or value is None:
+            return _VALID_FALSE
 
-        if isinstance(value, bool):
-            return ValidationResult(is_valid=True, sanitized_value=value)
-
-        # Try to convert string representations
+        # Try to convert string representations, normalizing only when the raw value isn't known
         if isinstance(value, str):
-            lower_value = value.lower().strip()
-            if lower_value in ("true", "1", "yes", "on"):
-                return ValidationResult(is_valid=True, sanitized_value=True)
-            elif lower_value in ("false", "0", "no", "off", ""):
-                return ValidationResult(is_valid=True, sanitized_value=False)
+            parsed = cls.BOOLEAN_STRINGS.get(value)
+            if parsed is None:
+                parsed = cls.BOOLEAN_STRINGS.get(value.strip().lower())
+            if parsed is not None:
+                return _VALID_TRUE if parsed else _VALID_FALSE
 
-        # Try to convert numeric values
+        # Try to convert numeric values (bool is an int subclass, but both bools were handled above)
         if isinstance(value, (int, float)):
-            return ValidationResult(is_valid=True, sanitized_value=bool(value))
+            return _VALID_TRUE if value else _VALID_FALSE
+
+        return ValidationResult(is_valid=False, errors=[f"{field_name} must be a boolean value (true/false)"])
+
+
+# Validator for each MCP tool parameter, keyed by parameter name
+_PARAM_VALIDATORS: Dict[str, Callable[[Any], ValidationResult]] = {
+    "feature_name": InputValidator.validate_feature_name,
+    "initial_idea": InputValidator.validate_initial_idea,
+    "document_type": InputValidator.validate_document_type,
+    "content": InputValidator.validate_document_content,
+    "phase_approval": lambda value: InputValidator.validate_boolean(value, "phase_approval"),
+    "resolve_references": lambda value: InputValidator.validate_boolean(value, "resolve_references"),
+    "task_identifier": InputValidator.validate_task_identifier,
+}
+
+
+def _param_error(field_name: str, value: Any, reason: str) -> SpecError:
+    """Build the error raised when a parameter fails validation."""
+    if field_name == "feature_name":
+        return _invalid_spec_name(value, reason)
+    if field_name == "content":
+        # Don't echo whole documents back in error details
+        return _validation_error("content", "document content", reason)
+    return _validation_error(field_name, value, reason)
+
 
-        errors.append(f"{field_name} must be a boolean value (true/false)")
-        return ValidationResult(is_valid=False, errors=errors)
+def _validate_params(**params: Any) -> Dict[str, Any]:
+    """
+    Validate parameters in order using their registered validators.
+
+    Args:
+        **params: Parameter values keyed by parameter name
+
+    Returns:
+        Dictionary with sanitized parameters
+
+    Raises:
+        SpecError: On the first parameter that fails validation
+    """
+    sanitized = {}
+    for field_name, value in params.items():
+        result = _PARAM_VALIDATORS[field_name](value)
+        if not result.is_valid:
+            errors = result.errors
+            raise _param_error(field_name, value, errors[0] if len(errors) == 1 else "; ".join(errors))
+        sanitized[field_name] = result.sanitized_value
+    return sanitized
 
 
 def validate_create_spec_params(feature_name: str, initial_idea: str) -> Dict[str, Any]:
@@ -359,20 +429,7 @@ def validate_create_spec_params(feature_name: str, initial_idea: str) -> Dict[st
     Raises:
         SpecError: If validation fails
     """
-    # Validate feature name
-    name_result = InputValidator.validate_feature_name(feature_name)
-    if not name_result.is_valid:
-        raise ErrorFactory.invalid_spec_name(feature_name, "; ".join(name_result.errors))
-
-    # Validate initial idea
-    idea_result = InputValidator.validate_initial_idea(initial_idea)
-    if not idea_result.is_valid:
-        raise ErrorFactory.validation_error("initial_idea", initial_idea, "; ".join(idea_result.errors))
-
-    return {
-        "feature_name": name_result.sanitized_value,
-        "initial_idea": idea_result.sanitized_value,
-    }
+    return _validate_params(feature_name=feature_name, initial_idea=initial_idea)
 
 
 def validate_update_spec_params(feature_name: str, document_type: str, content: str, phase_approval: Any = False) -> Dict[str, Any]:
@@ -391,32 +448,7 @@ def validate_update_spec_params(feature_name: str, document_type: str, content:
     Raises:
         SpecError: If validation fails
     """
-    # Validate feature name
-    name_result = InputValidator.validate_feature_name(feature_name)
-    if not name_result.is_valid:
-        raise ErrorFactory.invalid_spec_name(feature_name, "; ".join(name_result.errors))
-
-    # Validate document type
-    type_result = InputValidator.validate_document_type(document_type)
-    if not type_result.is_valid:
-        raise ErrorFactory.validation_error("document_type", document_type, "; ".join(type_result.errors))
-
-    # Validate content
-    content_result = InputValidator.validate_document_content(content)
-    if not content_result.is_valid:
-        raise ErrorFactory.validation_error("content", "document content", "; ".join(content_result.errors))
-
-    # Validate phase approval
-    approval_result = InputValidator.validate_boolean(phase_approval, "phase_approval")
-    if not approval_result.is_valid:
-        raise ErrorFactory.validation_error("phase_approval", phase_approval, "; ".join(approval_result.errors))
-
-    return {
-        "feature_name": name_result.sanitized_value,
-        "document_type": type_result.sanitized_value,
-        "content": content_result.sanitized_value,
-        "phase_approval": approval_result.sanitized_value,
-    }
+    return _validate_params(feature_name=feature_name, document_type=document_type, content=content, phase_approval=phase_approval)
 
 
 def validate_read_spec_params(feature_name: str, document_type: str, resolve_references: Any = True) -> Dict[str, Any]:
@@ -434,26 +466,7 @@ def validate_read_spec_params(feature_name: str, document_type: str, resolve_ref
     Raises:
         SpecError: If validation fails
     """
-    # Validate feature name
-    name_result = InputValidator.validate_feature_name(feature_name)
-    if not name_result.is_valid:
-        raise ErrorFactory.invalid_spec_name(feature_name, "; ".join(name_result.errors))
-
-    # Validate document type
-    type_result = InputValidator.validate_document_type(document_type)
-    if not type_result.is_valid:
-        raise ErrorFactory.validation_error("document_type", document_type, "; ".join(type_result.errors))
-
-    # Validate resolve_references
-    resolve_result = InputValidator.validate_boolean(resolve_references, "resolve_references")
-    if not resolve_result.is_valid:
-        raise ErrorFactory.validation_error("resolve_references", resolve_references, "; ".join(resolve_result.errors))
-
-    return {
-        "feature_name": name_result.sanitized_value,
-        "document_type": type_result.sanitized_value,
-        "resolve_references": resolve_result.sanitized_value,
-    }
+    return _validate_params(feature_name=feature_name, document_type=document_type, resolve_references=resolve_references)
 
 
 def validate_task_params(feature_name: str, task_identifier: Optional[str] = None) -> Dict[str, Any]:
@@ -470,17 +483,4 @@ def validate_task_params(feature_name: str, task_identifier: Optional[str] = Non
     Raises:
         SpecError: If validation fails
     """
-    # Validate feature name
-    name_result = InputValidator.validate_feature_name(feature_name)
-    if not name_result.is_valid:
-        raise ErrorFactory.invalid_spec_name(feature_name, "; ".join(name_result.errors))
-
-    # Validate task identifier
-    task_result = InputValidator.validate_task_identifier(task_identifier)
-    if not task_result.is_valid:
-        raise ErrorFactory.validation_error("task_identifier", task_identifier, "; ".join(task_result.errors))
-
-    return {
-        "feature_name": name_result.sanitized_value,
-        "task_identifier": task_result.sanitized_value,
-    }
+    return _validate_params(feature_name=feature_name, task_identifier=task_identifier)
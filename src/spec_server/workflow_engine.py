@@ -6,12 +6,55 @@ progression (Requirements → Design → Tasks). It tracks the current phase of
 validates phase transitions, and ensures users cannot skip phases without proper approval.
 """
 
+import os
+import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import AbstractSet, Any, Dict, FrozenSet, List, Mapping, Optional, Set, Tuple
 
 from .models import Phase, Spec
 from .spec_manager import SpecManager
 
+_REQUIREMENTS_FILE = "requirements.md"
+_DESIGN_FILE = "design.md"
+_TASKS_FILE = "tasks.md"
+
+# Directory listings are only cached once the directory mtime is older than this, so
+# changes landing within the filesystem's timestamp granularity are never missed
+_LISTING_SETTLE_NS = 2_000_000_000
+
+# Upper bound on the number of spec directory listings kept in memory
+_LISTING_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=None)
+def _transition_table(phase_order: Tuple[Phase, ...]) -> Mapping[Phase, Tuple[str, ...]]:
+    """Compute the available transitions from each phase of a phase ordering."""
+    table = {}
+    for current_index, current_phase in enumerate(phase_order):
+        # Can always stay in current phase, or go back to previous phases
+        transitions = [current_phase.value] + [phase.value for phase in phase_order[:current_index]]
+
+        # Can advance to next phase if not at end
+        if current_index < len(phase_order) - 1:
+            transitions.append(phase_order[current_index + 1].value)
+
+        table[current_phase] = tuple(transitions)
+    return MappingProxyType(table)
+
+
+@lru_cache(maxsize=None)
+def _transition_mask(phase_order: Tuple[Phase, ...]) -> int:
+    """Encode the allowed transitions of a phase ordering as a bitmap with bit ``from * n + to`` set when allowed."""
+    phase_count = len(phase_order)
+    mask = 0
+    for from_index in range(phase_count):
+        for to_index in range(phase_count):
+            if to_index <= from_index or to_index == from_index + 1:
+                mask |= 1 << (from_index * phase_count + to_index)
+    return mask
+
 
 class WorkflowError(Exception):
     """Exception raised when workflow operations fail."""
@@ -51,7 +94,25 @@ class WorkflowEngine:
             Phase.TASKS,
             Phase.COMPLETE,
         ]
-        self.approval_tracking: Dict[str, Dict[str, bool]] = {}
+        self._approvals: Set[Tuple[str, str]] = set()
+        self._listing_cache: Dict[str, Tuple[Tuple[int, int], FrozenSet[str]]] = {}
+        self._pending_metadata: Dict[str, Dict[str, Any]] = {}
+        self._phase_index = {phase: index for index, phase in enumerate(self.phase_order)}
+        self._transitions_by_phase = _transition_table(tuple(self.phase_order))
+        self._transition_mask = _transition_mask(tuple(self.phase_order))
+
+    @property
+    def approval_tracking(self) -> Dict[str, Dict[str, bool]]:
+        """
+        Get the recorded phase approvals, keyed by feature name and then phase.
+
+        The dictionary is rebuilt from the approvals set on each access, so changes
+        made to it are not recorded; approvals are recorded by advance_phase.
+        """
+        tracking: Dict[str, Dict[str, bool]] = {}
+        for feature_name, phase in self._approvals:
+            tracking.setdefault(feature_name, {})[phase] = True
+        return tracking
 
     def get_current_phase(self, spec: Spec) -> Phase:
         """
@@ -68,26 +129,7 @@ class WorkflowEngine:
         """
         try:
             # Check which files exist to determine phase
-            requirements_exists = spec.get_requirements_path().exists()
-            design_exists = spec.get_design_path().exists()
-            tasks_exists = spec.get_tasks_path().exists()
-
-            # Determine phase based on file existence and explicit approval status
-            # Phase advancement requires explicit approval
-            if tasks_exists and self._is_phase_approved(spec.feature_name, "tasks"):
-                return Phase.COMPLETE
-            elif tasks_exists:
-                return Phase.TASKS
-            elif design_exists and self._is_phase_approved(spec.feature_name, "design"):
-                return Phase.TASKS
-            elif design_exists:
-                return Phase.DESIGN
-            elif requirements_exists and self._is_phase_approved(spec.feature_name, "requirements"):
-                return Phase.DESIGN
-            elif requirements_exists:
-                return Phase.REQUIREMENTS
-            else:
-                return Phase.REQUIREMENTS
+            return self._compute_phase(spec.feature_name, self._existing_phase_files(spec))
 
         except Exception as e:
             raise WorkflowError(
@@ -96,7 +138,7 @@ class WorkflowEngine:
                 details={"feature_name": spec.feature_name, "error": str(e)},
             )
 
-    def can_advance_phase(self, spec: Spec, approval: bool = False) -> bool:
+    def can_advance_phase(self, spec: Spec, approval: bool = False, current_phase: Optional[Phase] = None) -> bool:
         """
         Check if a spec can advance to the next phase.
 
@@ -104,6 +146,7 @@ class WorkflowEngine:
             spec: Spec instance
             approval: Whether user has provided explicit approval for this operation.
                      Must be True for phase advancement unless already approved.
+            current_phase: Precomputed current phase (determined from disk if omitted)
 
         Returns:
             True if spec can advance to next phase
@@ -112,22 +155,10 @@ class WorkflowEngine:
             WorkflowError: If validation fails
         """
         try:
-            current_phase = self.get_current_phase(spec)
-
-            # Cannot advance from COMPLETE phase
-            if current_phase == Phase.COMPLETE:
-                return False
+            if current_phase is None:
+                current_phase = self.get_current_phase(spec)
 
-            # Explicit approval is required for phase advancement
-            # Either the phase must already be approved or explicit approval must be provided now
-            if not approval and not self._is_phase_approved(spec.feature_name, current_phase.value):
-                return False
-
-            # Check if required files exist for current phase
-            if not self._validate_phase_requirements(spec, current_phase):
-                return False
-
-            return True
+            return self._can_advance_from(spec, current_phase, approval)
 
         except Exception as e:
             raise WorkflowError(
@@ -136,7 +167,7 @@ class WorkflowEngine:
                 details={"feature_name": spec.feature_name, "error": str(e)},
             )
 
-    def advance_phase(self, spec: Spec, approval: bool = True) -> Phase:
+    def advance_phase(self, spec: Spec, approval: bool = True, defer: bool = False) -> Phase:
         """
         Advance a spec to the next phase.
 
@@ -144,6 +175,7 @@ class WorkflowEngine:
             spec: Spec instance
             approval: Whether user has provided explicit approval for this operation
                      This parameter should be True for explicit user approval
+            defer: Queue the metadata update until flush_metadata() instead of writing it now
 
         Returns:
             New phase after advancement
@@ -151,8 +183,9 @@ class WorkflowEngine:
         Raises:
             WorkflowError: If advancement is not allowed
         """
-        if not self.can_advance_phase(spec, approval):
-            current_phase = self.get_current_phase(spec)
+        current_phase = self.get_current_phase(spec)
+
+        if not self.can_advance_phase(spec, approval, current_phase):
             raise WorkflowError(
                 f"Cannot advance spec '{spec.feature_name}' from phase '{current_phase.value}' without explicit approval",
                 error_code="PHASE_ADVANCEMENT_DENIED",
@@ -164,25 +197,23 @@ class WorkflowEngine:
             )
 
         try:
-            current_phase = self.get_current_phase(spec)
-
             # Record approval for current phase
             if approval:
                 self._record_phase_approval(spec.feature_name, current_phase.value)
 
             # Determine next phase
-            current_index = self.phase_order.index(current_phase)
+            current_index = self._phase_index[current_phase]
             if current_index < len(self.phase_order) - 1:
                 next_phase = self.phase_order[current_index + 1]
             else:
                 next_phase = Phase.COMPLETE
 
             # Update spec metadata
-            self.spec_manager.update_spec_metadata(
-                spec.feature_name,
-                current_phase=next_phase.value,
-                last_phase_advancement=datetime.now().isoformat(),
-            )
+            updates = {"current_phase": next_phase.value, "last_phase_advancement": datetime.now().isoformat()}
+            if defer:
+                self._pending_metadata.setdefault(spec.feature_name, {}).update(updates)
+            else:
+                self.spec_manager.update_spec_metadata(spec.feature_name, **updates)
 
             return next_phase
 
@@ -193,6 +224,30 @@ class WorkflowEngine:
                 details={"feature_name": spec.feature_name, "error": str(e)},
             )
 
+    def flush_metadata(self) -> None:
+        """
+        Write metadata updates queued by deferred phase advancements.
+
+        All pending updates are written to the metadata registry at once, with later
+        advancements of the same spec overriding earlier ones.
+
+        Raises:
+            WorkflowError: If the metadata cannot be written (pending updates are kept)
+        """
+        if not self._pending_metadata:
+            return
+
+        try:
+            self.spec_manager.update_specs_metadata(self._pending_metadata)
+        except Exception as e:
+            raise WorkflowError(
+                f"Failed to write deferred workflow metadata: {str(e)}",
+                error_code="METADATA_FLUSH_ERROR",
+                details={"feature_names": list(self._pending_metadata), "error": str(e)},
+            )
+
+        self._pending_metadata = {}
+
     def validate_phase_transition(self, from_phase: Phase, to_phase: Phase) -> bool:
         """
         Validate if a phase transition is allowed.
@@ -205,49 +260,29 @@ class WorkflowEngine:
             True if transition is valid
 
         Raises:
-            WorkflowError: If validation fails
+            WorkflowError: If either phase is not part of the workflow
         """
-        try:
-            # Allow staying in same phase
-            if from_phase == to_phase:
-                return True
-
-            # Get phase indices
-            try:
-                from_index = self.phase_order.index(from_phase)
-                to_index = self.phase_order.index(to_phase)
-            except ValueError as e:
-                raise WorkflowError(
-                    f"Invalid phase in transition: {str(e)}",
-                    error_code="INVALID_PHASE",
-                    details={
-                        "from_phase": from_phase.value,
-                        "to_phase": to_phase.value,
-                    },
-                )
-
-            # Allow forward progression (one step at a time)
-            if to_index == from_index + 1:
-                return True
-
-            # Allow backward progression (for revisions)
-            if to_index < from_index:
-                return True
-
-            # Disallow skipping phases forward
-            return False
+        # Allow staying in same phase
+        if from_phase == to_phase:
+            return True
 
-        except Exception as e:
+        # Get phase indices
+        try:
+            from_index = self._phase_index[from_phase]
+            to_index = self._phase_index[to_phase]
+        except KeyError as e:
             raise WorkflowError(
-                f"Failed to validate phase transition: {str(e)}",
-                error_code="PHASE_TRANSITION_VALIDATION_ERROR",
+                f"Invalid phase in transition: {str(e)}",
+                error_code="INVALID_PHASE",
                 details={
                     "from_phase": from_phase.value,
                     "to_phase": to_phase.value,
-                    "error": str(e),
                 },
             )
 
+        # Forward by one step or backward (for revisions); skipping phases forward is disallowed
+        return bool(self._transition_mask >> (from_index * len(self.phase_order) + to_index) & 1)
+
     def require_approval(self, spec: Spec, phase: Optional[Phase] = None) -> bool:
         """
         Check if a phase requires user approval before advancement.
@@ -262,22 +297,14 @@ class WorkflowEngine:
             True if approval is required (which is always the case unless already approved)
 
         Raises:
-            WorkflowError: If validation fails
+            WorkflowError: If the current phase cannot be determined
         """
-        try:
-            if phase is None:
-                phase = self.get_current_phase(spec)
+        if phase is None:
+            phase = self.get_current_phase(spec)
 
-            # All phases require explicit approval before advancement
-            # Only return False if the phase has already been approved
-            return not self._is_phase_approved(spec.feature_name, phase.value)
-
-        except Exception as e:
-            raise WorkflowError(
-                f"Failed to check approval requirement: {str(e)}",
-                error_code="APPROVAL_CHECK_ERROR",
-                details={"feature_name": spec.feature_name, "error": str(e)},
-            )
+        # All phases require explicit approval before advancement
+        # Only return False if the phase has already been approved
+        return not self._is_phase_approved(spec.feature_name, phase.value)
 
     def get_phase_status(self, spec: Spec) -> Dict[str, Any]:
         """
@@ -293,18 +320,20 @@ class WorkflowEngine:
             WorkflowError: If status cannot be determined
         """
         try:
-            current_phase = self.get_current_phase(spec)
+            # List the spec directory once and reuse the result throughout
+            existing_files = self._existing_phase_files(spec)
+            current_phase = self._compute_phase(spec.feature_name, existing_files)
 
             status = {
                 "current_phase": current_phase.value,
-                "can_advance": self.can_advance_phase(spec),
-                "requires_approval": self.require_approval(spec),
+                "can_advance": self._can_advance_from(spec, current_phase, False, existing_files),
+                "requires_approval": self.require_approval(spec, current_phase),
                 "phase_approvals": self._get_phase_approvals(spec.feature_name),
-                "available_transitions": self._get_available_transitions(current_phase),
+                "available_transitions": list(self._get_available_transitions(current_phase)),
                 "phase_files": {
-                    "requirements": spec.get_requirements_path().exists(),
-                    "design": spec.get_design_path().exists(),
-                    "tasks": spec.get_tasks_path().exists(),
+                    "requirements": _REQUIREMENTS_FILE in existing_files,
+                    "design": _DESIGN_FILE in existing_files,
+                    "tasks": _TASKS_FILE in existing_files,
                 },
             }
 
@@ -324,8 +353,7 @@ class WorkflowEngine:
         Args:
             feature_name: Feature name to reset approvals for
         """
-        if feature_name in self.approval_tracking:
-            del self.approval_tracking[feature_name]
+        self._approvals = {approval for approval in self._approvals if approval[0] != feature_name}
 
     def get_workflow_history(self, spec: Spec) -> List[Dict[str, str]]:
         """
@@ -357,10 +385,10 @@ class WorkflowEngine:
 
             # Add phase progression events based on file existence and approvals
             # current_phase = self.get_current_phase(spec)  # Not used currently
-            approvals = self._get_phase_approvals(spec.feature_name)
+            approvals = self._approvals
 
-            for phase in [Phase.REQUIREMENTS, Phase.DESIGN, Phase.TASKS]:
-                if phase.value in approvals and approvals[phase.value]:
+            for phase in (Phase.REQUIREMENTS, Phase.DESIGN, Phase.TASKS):
+                if (spec.feature_name, phase.value) in approvals:
                     history.append(
                         {
                             "event": "phase_approved",
@@ -379,51 +407,104 @@ class WorkflowEngine:
                 details={"feature_name": spec.feature_name, "error": str(e)},
             )
 
+    def _can_advance_from(self, spec: Spec, current_phase: Phase, approval: bool, existing_files: Optional[AbstractSet[str]] = None) -> bool:
+        """Check if a spec can advance from an already determined phase."""
+        # Cannot advance from COMPLETE phase
+        if current_phase == Phase.COMPLETE:
+            return False
+
+        # Explicit approval is required for phase advancement
+        # Either the phase must already be approved or explicit approval must be provided now
+        if not approval and not self._is_phase_approved(spec.feature_name, current_phase.value):
+            return False
+
+        # Check if required files exist for current phase
+        return self._validate_phase_requirements(spec, current_phase, existing_files)
+
+    def _existing_phase_files(self, spec: Spec) -> FrozenSet[str]:
+        """
+        List the names of the files in the spec directory.
+
+        The listing is cached against the directory inode and mtime. The mtime changes
+        whenever a file is created, removed or renamed in it, and the inode changes when
+        the directory is replaced, e.g. by a copy that preserves the mtime. Repeated
+        queries therefore cost a single stat.
+        """
+        key = str(spec.base_path)
+        try:
+            stat_result = os.stat(key)
+            mtime_ns = stat_result.st_mtime_ns
+            identity = (stat_result.st_ino, mtime_ns)
+            cached = self._listing_cache.get(key)
+            if cached is not None and cached[0] == identity:
+                return cached[1]
+
+            with os.scandir(key) as entries:
+                names = frozenset(entry.name for entry in entries if entry.is_file())
+        except (FileNotFoundError, NotADirectoryError):
+            return frozenset()
+
+        if time.time_ns() - mtime_ns > _LISTING_SETTLE_NS:
+            self._listing_cache.pop(key, None)
+            if len(self._listing_cache) >= _LISTING_CACHE_SIZE:
+                # Evict the oldest entry; dicts preserve insertion order
+                del self._listing_cache[next(iter(self._listing_cache))]
+            self._listing_cache[key] = (identity, names)
+        return names
+
+    def _compute_phase(self, feature_name: str, existing_files: AbstractSet[str]) -> Phase:
+        """Determine the phase from which phase files exist and explicit approval status."""
+        requirements_exists = _REQUIREMENTS_FILE in existing_files
+        design_exists = _DESIGN_FILE in existing_files
+        tasks_exists = _TASKS_FILE in existing_files
+
+        # Phase advancement requires explicit approval
+        if tasks_exists and self._is_phase_approved(feature_name, "tasks"):
+            return Phase.COMPLETE
+        elif tasks_exists:
+            return Phase.TASKS
+        elif design_exists and self._is_phase_approved(feature_name, "design"):
+            return Phase.TASKS
+        elif design_exists:
+            return Phase.DESIGN
+        elif requirements_exists and self._is_phase_approved(feature_name, "requirements"):
+            return Phase.DESIGN
+        else:
+            return Phase.REQUIREMENTS
+
     def _is_phase_approved(self, feature_name: str, phase: str) -> bool:
         """
         Check if a phase has been approved.
 
         A phase is considered approved only if it has been explicitly approved
-        by recording it in the approval_tracking dictionary.
+        by recording its (feature_name, phase) pair in the approvals set.
         """
-        return feature_name in self.approval_tracking and phase in self.approval_tracking[feature_name] and self.approval_tracking[feature_name][phase]
+        return (feature_name, phase) in self._approvals
 
     def _record_phase_approval(self, feature_name: str, phase: str) -> None:
         """Record approval for a phase."""
-        if feature_name not in self.approval_tracking:
-            self.approval_tracking[feature_name] = {}
-        self.approval_tracking[feature_name][phase] = True
+        self._approvals.add((feature_name, phase))
 
     def _get_phase_approvals(self, feature_name: str) -> Dict[str, bool]:
         """Get all phase approvals for a feature."""
-        return self.approval_tracking.get(feature_name, {})
+        return {phase.value: True for phase in self.phase_order if (feature_name, phase.value) in self._approvals}
 
-    def _validate_phase_requirements(self, spec: Spec, phase: Phase) -> bool:
+    def _validate_phase_requirements(self, spec: Spec, phase: Phase, existing_files: Optional[AbstractSet[str]] = None) -> bool:
         """Validate that required files exist for a phase."""
         if phase == Phase.REQUIREMENTS:
             return True  # No file required to start requirements
-        elif phase == Phase.DESIGN:
-            return spec.get_requirements_path().exists()
+
+        if existing_files is None:
+            existing_files = self._existing_phase_files(spec)
+
+        if phase == Phase.DESIGN:
+            return _REQUIREMENTS_FILE in existing_files
         elif phase == Phase.TASKS:
-            return spec.get_requirements_path().exists() and spec.get_design_path().exists()
+            return _REQUIREMENTS_FILE in existing_files and _DESIGN_FILE in existing_files
         elif phase == Phase.COMPLETE:
-            return spec.get_requirements_path().exists() and spec.get_design_path().exists() and spec.get_tasks_path().exists()
+            return _REQUIREMENTS_FILE in existing_files and _DESIGN_FILE in existing_files and _TASKS_FILE in existing_files
         return False
 
-    def _get_available_transitions(self, current_phase: Phase) -> List[str]:
-        """Get list of available phase transitions."""
-        transitions = []
-
-        # Can always stay in current phase
-        transitions.append(current_phase.value)
-
-        # Can go back to previous phases
-        current_index = self.phase_order.index(current_phase)
-        for i in range(current_index):
-            transitions.append(self.phase_order[i].value)
-
-        # Can advance to next phase if not at end
-        if current_index < len(self.phase_order) - 1:
-            transitions.append(self.phase_order[current_index + 1].value)
-
-        return transitions
+    def _get_available_transitions(self, current_phase: Phase) -> Tuple[str, ...]:
+        """Get available phase transitions."""
+        return self._transitions_by_phase[current_phase]
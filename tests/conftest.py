@@ -2,38 +2,24 @@
 Pytest configuration and fixtures for spec-server tests.
 """
 
-import tempfile
-from pathlib import Path
-
 import pytest
 
+from spec_server.config import ServerConfig
 from spec_server.mcp_tools import MCPTools
-from tests.fixtures import MockFileSystem, SpecTestFixtures, TestDataGenerator
+from tests.fixtures import MockFileSystem, SpecTemplateCache, SpecTestFixtures, TestDataGenerator
 
 
 @pytest.fixture
-def temp_specs_dir():
+def temp_specs_dir(tmp_path):
     """Provide a temporary directory for spec testing."""
-    temp_dir = Path(tempfile.mkdtemp())
-    yield temp_dir
-
-    # Cleanup
-    import shutil
-
-    shutil.rmtree(temp_dir, ignore_errors=True)
+    return tmp_path
 
 
 # Keep the old fixture name for backward compatibility
 @pytest.fixture
-def temp_spec_dir():
+def temp_spec_dir(temp_specs_dir):
     """Provide a temporary directory for spec testing (alias for temp_specs_dir)."""
-    temp_dir = Path(tempfile.mkdtemp())
-    yield temp_dir
-
-    # Cleanup
-    import shutil
-
-    shutil.rmtree(temp_dir, ignore_errors=True)
+    return temp_specs_dir
 
 
 @pytest.fixture
@@ -42,10 +28,22 @@ def mcp_tools(temp_specs_dir):
     return MCPTools(base_path=temp_specs_dir)
 
 
+@pytest.fixture(scope="module")
+def default_server_config():
+    """Provide a default ServerConfig shared by the tests of a module (do not mutate)."""
+    return ServerConfig()
+
+
+@pytest.fixture(scope="session")
+def _spec_template_cache(tmp_path_factory):
+    """Provide the session-wide cache of prebuilt sample specifications."""
+    return SpecTemplateCache(tmp_path_factory.mktemp("spec-templates"))
+
+
 @pytest.fixture
-def spec_fixtures(temp_specs_dir):
+def spec_fixtures(temp_specs_dir, _spec_template_cache):
     """Provide SpecTestFixtures instance."""
-    fixtures = SpecTestFixtures(base_path=temp_specs_dir)
+    fixtures = SpecTestFixtures(base_path=temp_specs_dir, template_cache=_spec_template_cache)
     yield fixtures
     fixtures.cleanup()
 
@@ -71,13 +69,20 @@ def multiple_specs(spec_fixtures):
     return results
 
 
-@pytest.fixture
-def mock_filesystem():
-    """Provide a mock file system for testing."""
+@pytest.fixture(scope="module")
+def _module_mock_filesystem():
+    """Provide a mock file system shared by the tests of a module."""
     return MockFileSystem()
 
 
 @pytest.fixture
+def mock_filesystem(_module_mock_filesystem):
+    """Provide a mock file system for testing."""
+    _module_mock_filesystem.clear()
+    return _module_mock_filesystem
+
+
+@pytest.fixture(scope="session")
 def test_data_generator():
     """Provide test data generator."""
     return TestDataGenerator()
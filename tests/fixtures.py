@@ -5,13 +5,34 @@ This module provides reusable test fixtures, sample data, and utility functions
 for testing spec-server functionality.
 """
 
+import asyncio
 import json
+import os
+import shutil
 import tempfile
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Tuple, Union
+
+import pytest
 
 from spec_server.mcp_tools import MCPTools
 
+# Reference files written verbatim by SpecTestFixtures.create_spec_with_file_references
+_API_SPEC_JSON = json.dumps(
+    {
+        "openapi": "3.0.0",
+        "info": {"title": "Test API", "version": "1.0.0"},
+        "paths": {
+            "/users": {"get": {"summary": "Get users"}},
+            "/auth": {"post": {"summary": "Authenticate user"}},
+        },
+    },
+    indent=2,
+).encode("utf-8")
+_API_README = b"# API Documentation\n\nThis is the main API documentation."
+
 
 class SpecTestData:
     """Sample specification data for testing."""
@@ -29,6 +50,7 @@ class SpecTestData:
         "payment-processing": "Integrate payment gateway for subscription billing",
         "audit-logging": "Comprehensive audit logging for security and compliance",
     }
+    _ALL_FEATURE_NAMES: Tuple[str, ...] = tuple(FEATURE_IDEAS)
 
     # Sample requirements document
     SAMPLE_REQUIREMENTS = """# Requirements Document
@@ -235,18 +257,46 @@ Standard HTTP status codes with JSON error responses:
         return cls.FEATURE_IDEAS.get(feature_name, f"Sample feature idea for {feature_name}")
 
     @classmethod
-    def get_all_feature_names(cls) -> List[str]:
+    def get_all_feature_names(cls) -> Tuple[str, ...]:
         """Get all available feature names."""
-        return list(cls.FEATURE_IDEAS.keys())
+        return cls._ALL_FEATURE_NAMES
+
+    @classmethod
+    def iter_feature_names(cls, limit: Optional[int] = None) -> Iterator[str]:
+        """Iterate over at most limit available feature names."""
+        return islice(cls._ALL_FEATURE_NAMES, limit)
 
 
 class SpecTestFixtures:
     """Test fixtures for creating and managing test specifications."""
 
-    def __init__(self, base_path: Optional[Path] = None):
-        """Initialize test fixtures with optional base path."""
-        self.base_path = base_path or Path(tempfile.mkdtemp())
+    def __init__(
+        self,
+        base_path: Optional[Union[str, Path]] = None,
+        template_cache: Optional["SpecTemplateCache"] = None,
+        tmp_path_factory: Optional[pytest.TempPathFactory] = None,
+    ):
+        """
+        Initialize test fixtures.
+
+        Without a base path the fixtures create their own directory: under pytest's
+        temporary directory when tmp_path_factory is given, otherwise under
+        SPEC_SERVER_TEST_TMPDIR (e.g. a tmpfs mount) or the system temp directory.
+
+        Args:
+            base_path: Directory to create specs in (str or Path)
+            template_cache: Cache of prebuilt sample specs to copy from
+            tmp_path_factory: pytest factory used to create the directory
+        """
+        self.owns_base_path = base_path is None
+        if base_path is None:
+            if tmp_path_factory is not None:
+                base_path = tmp_path_factory.mktemp("spec_fixtures")
+            else:
+                base_path = tempfile.mkdtemp(prefix="spec_fixtures_", dir=os.environ.get("SPEC_SERVER_TEST_TMPDIR"))
+        self.base_path = base_path if isinstance(base_path, Path) else Path(base_path)
         self.mcp_tools = MCPTools(base_path=self.base_path)
+        self.template_cache = template_cache
         self.created_specs: List[str] = []
 
     def create_sample_spec(self, feature_name: str, phase: str = "requirements") -> Dict[str, Any]:
@@ -260,6 +310,13 @@ class SpecTestFixtures:
         Returns:
             Dictionary with spec creation result
         """
+        # Later phases are built from prebuilt documents when a cache is available and the name is still free
+        if self.template_cache is not None and phase != "requirements" and not (self.base_path / feature_name).exists():
+            cached_result = self.template_cache.install(feature_name, phase, self.mcp_tools)
+            if cached_result is not None:
+                self.created_specs.append(feature_name)
+                return cached_result
+
         # Get sample idea
         idea = SpecTestData.get_feature_idea(feature_name)
 
@@ -299,14 +356,23 @@ class SpecTestFixtures:
         Returns:
             List of spec creation results
         """
-        results = []
-        feature_names = SpecTestData.get_all_feature_names()[:count]
+        return [self.create_sample_spec(feature_name) for feature_name in SpecTestData.iter_feature_names(count)]
 
-        for feature_name in feature_names:
-            result = self.create_sample_spec(feature_name)
-            results.append(result)
+    async def acreate_multiple_specs(self, count: int = 5) -> List[Dict[str, Any]]:
+        """
+        Create multiple sample specifications without blocking the event loop.
 
-        return results
+        MCPTools has no async entry points and its metadata registry is updated with
+        unlocked read-modify-write cycles, so the specs are created one after another
+        on a worker thread rather than concurrently.
+
+        Args:
+            count: Number of specs to create
+
+        Returns:
+            List of spec creation results
+        """
+        return await asyncio.to_thread(self.create_multiple_specs, count)
 
     def create_spec_with_file_references(self, feature_name: str) -> Dict[str, Any]:
         """
@@ -320,18 +386,10 @@ class SpecTestFixtures:
         """
         # Create external reference files
         api_spec_file = self.base_path / "api-spec.json"
-        api_spec_content = {
-            "openapi": "3.0.0",
-            "info": {"title": "Test API", "version": "1.0.0"},
-            "paths": {
-                "/users": {"get": {"summary": "Get users"}},
-                "/auth": {"post": {"summary": "Authenticate user"}},
-            },
-        }
-        api_spec_file.write_text(json.dumps(api_spec_content, indent=2))
+        api_spec_file.write_bytes(_API_SPEC_JSON)
 
         readme_file = self.base_path / "README.md"
-        readme_file.write_text("# API Documentation\n\nThis is the main API documentation.")
+        readme_file.write_bytes(_API_README)
 
         # Create spec
         result = self.create_sample_spec(feature_name)
@@ -387,18 +445,97 @@ This feature implements an API based on the OpenAPI specification.
             return self.create_sample_spec(feature_name, phase="tasks")
 
     def cleanup(self):
-        """Clean up all created test specifications."""
-        for feature_name in self.created_specs:
-            try:
-                self.mcp_tools.delete_spec(feature_name)
-            except Exception:
-                pass  # Ignore cleanup errors
-
-        # Clean up temporary directory
-        import shutil
+        """
+        Clean up all created test specifications.
 
-        if self.base_path.exists():
+        A temporary directory created by the fixtures is removed wholesale. A directory
+        supplied by the caller is left in place with only the created specs deleted.
+        """
+        if self.owns_base_path:
             shutil.rmtree(self.base_path, ignore_errors=True)
+        else:
+            for feature_name in self.created_specs:
+                try:
+                    self.mcp_tools.delete_spec(feature_name)
+                except Exception:
+                    pass  # Ignore cleanup errors
+
+        self.created_specs.clear()
+
+
+class SpecTemplateCache:
+    """Cache of sample specifications built once and copied into each test's directory."""
+
+    # Spec documents in workflow order, with the file each one is stored in
+    _DOCUMENTS = (("requirements", "requirements.md"), ("design", "design.md"), ("tasks", "tasks.md"))
+
+    def __init__(self, base_path: Path):
+        """Initialize the cache with the directory the templates are built in."""
+        self.base_path = base_path
+        self._builders: Dict[str, SpecTestFixtures] = {}
+        self._templates: Dict[Tuple[str, str], Optional[Tuple[Path, FrozenSet[str]]]] = {}
+
+    def install(self, feature_name: str, phase: str, mcp_tools: MCPTools) -> Optional[Dict[str, Any]]:
+        """
+        Create the sample spec for a feature and phase from its prebuilt documents.
+
+        The template is built with SpecTestFixtures.create_sample_spec on first use. The
+        spec is then created through mcp_tools, and the template documents are copied in
+        one at a time in workflow order. Each approved phase is advanced through the
+        workflow engine once its document is in place, so the result matches a spec
+        built from scratch without generating the design or tasks documents again.
+
+        Args:
+            feature_name: Name of the feature to create
+            phase: Phase to advance the spec to ("requirements", "design", "tasks")
+            mcp_tools: MCPTools instance owning the target directory
+
+        Returns:
+            Dictionary with spec creation result, or None if the template could not be built
+        """
+        template = self._get_template(feature_name, phase)
+        if template is None:
+            return None
+
+        template_dir, approvals = template
+        result = mcp_tools.create_spec(feature_name, SpecTestData.get_feature_idea(feature_name))
+        spec = mcp_tools.spec_manager.get_spec(feature_name)
+        workflow_engine = mcp_tools.workflow_engine
+        for document_type, file_name in self._DOCUMENTS:
+            source = template_dir / file_name
+            if source.exists():
+                shutil.copyfile(source, spec.base_path / file_name)
+                if document_type in approvals:
+                    workflow_engine.advance_phase(spec, approval=True)
+
+        if approvals:
+            mcp_tools.spec_manager.update_spec_metadata(
+                feature_name,
+                current_phase=workflow_engine.get_current_phase(spec).value,
+                has_requirements=spec.get_requirements_path().exists(),
+                has_design=spec.get_design_path().exists(),
+                has_tasks=spec.get_tasks_path().exists(),
+            )
+
+        return result
+
+    def _get_template(self, feature_name: str, phase: str) -> Optional[Tuple[Path, FrozenSet[str]]]:
+        """Build the template for a feature and phase unless it is already cached."""
+        key = (feature_name, phase)
+        if key not in self._templates:
+            # Each phase gets its own builder so the same feature can be cached at several phases
+            if phase not in self._builders:
+                self._builders[phase] = SpecTestFixtures(base_path=self.base_path / phase)
+            builder = self._builders[phase]
+
+            result = builder.create_sample_spec(feature_name, phase)
+            if result["success"]:
+                approvals = frozenset(builder.mcp_tools.workflow_engine.approval_tracking.get(feature_name, {}))
+                self._templates[key] = (builder.base_path / feature_name, approvals)
+            else:
+                self._templates[key] = None
+
+        return self._templates[key]
 
 
 class MockFileSystem:
@@ -412,10 +549,10 @@ class MockFileSystem:
     def create_file(self, path: str, content: str):
         """Create a mock file with content."""
         self.files[path] = content
-        # Add parent directories
-        parent = str(Path(path).parent)
-        if parent != ".":
-            self.directories.add(parent)
+        # Add parent directories (string split; avoids building a Path per file)
+        parent, separator, _ = path.rpartition("/")
+        if separator:
+            self.directories.add(parent or "/")
 
     def read_file(self, path: str) -> str:
         """Read content from mock file."""
@@ -442,85 +579,7 @@ class MockFileSystem:
         self.directories.clear()
 
 
-class TestDataGenerator:
-    """Generator for various test data scenarios."""
-
-    @staticmethod
-    def generate_feature_names(count: int) -> List[str]:
-        """Generate a list of valid feature names."""
-        base_names = [
-            "user-auth",
-            "data-export",
-            "api-integration",
-            "notification-system",
-            "file-upload",
-            "search-engine",
-            "reporting-dashboard",
-            "user-management",
-            "payment-processing",
-            "audit-logging",
-            "content-management",
-            "workflow-engine",
-            "email-service",
-            "backup-system",
-            "monitoring-dashboard",
-            "cache-layer",
-            "message-queue",
-            "image-processing",
-            "document-converter",
-            "analytics-engine",
-        ]
-
-        if count <= len(base_names):
-            return base_names[:count]
-
-        # Generate additional names if needed
-        additional = []
-        for i in range(count - len(base_names)):
-            additional.append(f"feature-{i+1:03d}")
-
-        return base_names + additional
-
-    @staticmethod
-    def generate_feature_ideas(count: int) -> List[str]:
-        """Generate a list of feature ideas."""
-        ideas = [
-            "Implement user authentication with OAuth2 and JWT tokens",
-            "Create data export functionality with multiple output formats",
-            "Build API integration layer for third-party services",
-            "Develop notification system with multiple delivery channels",
-            "Implement secure file upload with virus scanning",
-            "Create full-text search with advanced filtering",
-            "Build analytics dashboard with real-time metrics",
-            "Develop user management system with role-based access",
-            "Integrate payment processing with multiple gateways",
-            "Implement comprehensive audit logging system",
-            "Create content management system with versioning",
-            "Build workflow engine for business processes",
-            "Develop email service with template management",
-            "Implement automated backup and recovery system",
-            "Create monitoring dashboard with alerting",
-            "Build distributed cache layer for performance",
-            "Implement message queue for async processing",
-            "Create image processing service with transformations",
-            "Build document converter for multiple formats",
-            "Develop analytics engine for data insights",
-        ]
-
-        if count <= len(ideas):
-            return ideas[:count]
-
-        # Generate additional ideas if needed
-        additional = []
-        for i in range(count - len(ideas)):
-            additional.append(f"Feature {i+1} implementation with comprehensive functionality")
-
-        return ideas + additional
-
-    @staticmethod
-    def generate_unicode_content() -> str:
-        """Generate content with Unicode characters for testing."""
-        return """# Requirements Document 📋
+_UNICODE_CONTENT = """# Requirements Document 📋
 
 ## Introduction 🌟
 
@@ -544,10 +603,58 @@ This feature supports international users with Unicode characters:
 3. WHEN emoji are included THEN system SHALL display properly 😊
 """
 
-    @staticmethod
-    def generate_large_content(size_kb: int = 100) -> str:
-        """Generate large content for performance testing."""
-        base_content = """# Large Requirements Document
+
+_BASE_FEATURE_NAMES = (
+    "user-auth",
+    "data-export",
+    "api-integration",
+    "notification-system",
+    "file-upload",
+    "search-engine",
+    "reporting-dashboard",
+    "user-management",
+    "payment-processing",
+    "audit-logging",
+    "content-management",
+    "workflow-engine",
+    "email-service",
+    "backup-system",
+    "monitoring-dashboard",
+    "cache-layer",
+    "message-queue",
+    "image-processing",
+    "document-converter",
+    "analytics-engine",
+)
+
+_BASE_FEATURE_IDEAS = (
+    "Implement user authentication with OAuth2 and JWT tokens",
+    "Create data export functionality with multiple output formats",
+    "Build API integration layer for third-party services",
+    "Develop notification system with multiple delivery channels",
+    "Implement secure file upload with virus scanning",
+    "Create full-text search with advanced filtering",
+    "Build analytics dashboard with real-time metrics",
+    "Develop user management system with role-based access",
+    "Integrate payment processing with multiple gateways",
+    "Implement comprehensive audit logging system",
+    "Create content management system with versioning",
+    "Build workflow engine for business processes",
+    "Develop email service with template management",
+    "Implement automated backup and recovery system",
+    "Create monitoring dashboard with alerting",
+    "Build distributed cache layer for performance",
+    "Implement message queue for async processing",
+    "Create image processing service with transformations",
+    "Build document converter for multiple formats",
+    "Develop analytics engine for data insights",
+)
+
+
+@lru_cache(maxsize=8)
+def _generate_large_content(size_kb: int) -> str:
+    """Generate large content for performance testing."""
+    base_content = """# Large Requirements Document
 
 ## Introduction
 
@@ -555,8 +662,8 @@ This is a large document generated for performance testing purposes.
 
 """
 
-        # Calculate how many requirements needed to reach target size
-        requirement_template = """### Requirement {num}
+    # Calculate how many requirements needed to reach target size
+    requirement_template = """### Requirement {num}
 
 **User Story:** As a user, I want feature {num}, so that I can accomplish task {num}
 
@@ -568,14 +675,53 @@ This is a large document generated for performance testing purposes.
 
 """
 
-        content = base_content
-        requirement_num = 1
+    # Track the encoded size incrementally instead of re-encoding the whole document each time
+    parts = [base_content]
+    size = len(base_content.encode("utf-8"))
+    target_size = size_kb * 1024
+    requirement_num = 1
+
+    while size < target_size:
+        requirement = requirement_template.format(num=requirement_num)
+        parts.append(requirement)
+        size += len(requirement.encode("utf-8"))
+        requirement_num += 1
+
+    return "".join(parts)
 
-        while len(content.encode("utf-8")) < size_kb * 1024:
-            content += requirement_template.format(num=requirement_num)
-            requirement_num += 1
 
-        return content
+class TestDataGenerator:
+    """Generator for various test data scenarios."""
+
+    @staticmethod
+    def generate_feature_names(count: int) -> List[str]:
+        """Generate a list of valid feature names."""
+        base_names = _BASE_FEATURE_NAMES
+        if count <= len(base_names):
+            return list(base_names[:count])
+
+        # Generate additional names if needed
+        return [*base_names, *[f"feature-{i:03d}" for i in range(1, count - len(base_names) + 1)]]
+
+    @staticmethod
+    def generate_feature_ideas(count: int) -> List[str]:
+        """Generate a list of feature ideas."""
+        ideas = _BASE_FEATURE_IDEAS
+        if count <= len(ideas):
+            return list(ideas[:count])
+
+        # Generate additional ideas if needed
+        return [*ideas, *[f"Feature {i} implementation with comprehensive functionality" for i in range(1, count - len(ideas) + 1)]]
+
+    @staticmethod
+    def generate_unicode_content() -> str:
+        """Generate content with Unicode characters for testing."""
+        return _UNICODE_CONTENT
+
+    @staticmethod
+    def generate_large_content(size_kb: int = 100) -> str:
+        """Generate large content for performance testing."""
+        return _generate_large_content(size_kb)
 
 
 # Pytest fixtures are moved to conftest.py
@@ -3,37 +3,89 @@ Tests for the configuration management system.
 """
 
 import json
-import os
-import tempfile
 from pathlib import Path
-from unittest.mock import mock_open, patch
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
+from spec_server import config as config_module
 from spec_server.config import ConfigManager, ServerConfig, create_example_config, get_config, reload_config
 
+_EXPECTED_DEFAULTS = MappingProxyType(
+    {
+        "host": "127.0.0.1",
+        "port": 8000,
+        "transport": "stdio",
+        "specs_dir": "specs",
+        "auto_detect_workspace": True,
+        "workspace_specs_dir": ".specs",
+        "max_specs": 1000,
+        "max_document_size": 1_000_000,
+        "auto_backup": True,
+        "backup_dir": "backups",
+        "strict_validation": True,
+        "allow_dangerous_paths": False,
+        "log_level": "INFO",
+        "log_file": None,
+        "cache_enabled": True,
+        "cache_size": 100,
+    }
+)
+
+# Config file payloads, serialized once at import
+_VALID_CONFIG = {"host": "test-host", "port": 3000}
+_VALID_CONFIG_JSON = json.dumps(_VALID_CONFIG)
+_INTEGRATION_CONFIG_JSON = json.dumps(
+    {
+        "host": "integration-host",
+        "port": 4000,
+        "transport": "sse",
+        "specs_dir": "integration-specs",
+    }
+).encode("utf-8")
+
+
+@pytest.fixture(scope="class")
+def _class_config_manager():
+    """Provide a ConfigManager shared by the tests of a class."""
+    return ConfigManager()
+
+
+@pytest.fixture
+def fresh_manager(_class_config_manager):
+    """Provide the class-shared ConfigManager reset to its initial state."""
+    _class_config_manager.config_file = None
+    _class_config_manager._config = None
+    return _class_config_manager
+
+
+@pytest.fixture
+def patched_manager(monkeypatch, fresh_manager):
+    """Provide a factory for ConfigManagers whose file and env loaders return fixed data."""
+
+    def _factory(file_config, env_config):
+        manager = fresh_manager
+        monkeypatch.setattr(manager, "_load_from_file", lambda: file_config)
+        monkeypatch.setattr(manager, "_load_from_env", lambda: env_config)
+        return manager
+
+    return _factory
+
+
+@pytest.fixture(scope="session")
+def example_config_parsed():
+    """Provide the parsed example configuration."""
+    return json.loads(create_example_config())
+
 
 class TestServerConfig:
     """Test cases for ServerConfig model."""
 
-    def test_default_config(self):
+    def test_default_config(self, default_server_config):
         """Test default configuration values."""
-        config = ServerConfig()
-
-        assert config.host == "127.0.0.1"
-        assert config.port == 8000
-        assert config.transport == "stdio"
-        assert config.specs_dir == "specs"
-        assert config.max_specs == 1000
-        assert config.max_document_size == 1_000_000
-        assert config.auto_backup is True
-        assert config.backup_dir == "backups"
-        assert config.strict_validation is True
-        assert config.allow_dangerous_paths is False
-        assert config.log_level == "INFO"
-        assert config.log_file is None
-        assert config.cache_enabled is True
-        assert config.cache_size == 100
+        # Compare as a plain dict so pytest's assertion diff names the differing key
+        assert default_server_config.model_dump() == dict(_EXPECTED_DEFAULTS)
 
     def test_custom_config(self):
         """Test creating config with custom values."""
@@ -51,50 +103,36 @@ class TestServerConfig:
         assert config.specs_dir == "custom_specs"
         assert config.log_level == "DEBUG"
 
-    def test_invalid_transport(self):
-        """Test validation of invalid transport."""
-        with pytest.raises(ValueError, match="Transport must be"):
-            ServerConfig(transport="invalid")
-
-    def test_invalid_port(self):
-        """Test validation of invalid port."""
-        with pytest.raises(ValueError, match="Port must be between"):
-            ServerConfig(port=0)
-
-        with pytest.raises(ValueError, match="Port must be between"):
-            ServerConfig(port=70000)
-
-    def test_invalid_log_level(self):
-        """Test validation of invalid log level."""
-        with pytest.raises(ValueError, match="Log level must be one of"):
-            ServerConfig(log_level="INVALID")
-
-    def test_log_level_case_insensitive(self):
-        """Test that log level validation is case insensitive."""
-        config = ServerConfig(log_level="debug")
-        assert config.log_level == "DEBUG"
-
-    def test_invalid_directory(self):
-        """Test validation of invalid directory paths."""
-        with pytest.raises(ValueError, match="Directory path must be"):
-            ServerConfig(specs_dir="")
-
+    @pytest.mark.parametrize(
+        "kwargs,match",
+        [
+            ({"transport": "invalid"}, "Transport must be"),
+            ({"port": 0}, "Port must be between"),
+            ({"port": 70000}, "Port must be between"),
+            ({"log_level": "INVALID"}, "Log level must be one of"),
+            ({"specs_dir": ""}, "Directory path must be"),
+            ({"max_specs": 0}, "Value must be positive"),
+            ({"max_document_size": -1}, "Value must be positive"),
+            ({"cache_size": 0}, "Value must be positive"),
+        ],
+    )
+    def test_validation_errors(self, kwargs, match):
+        """Test validation of invalid field values."""
+        with pytest.raises(ValueError, match=match):
+            ServerConfig(**kwargs)
+
+    def test_invalid_directory_type(self):
+        """Test validation of a non-string directory path."""
         # Pydantic V2 raises ValidationError for type mismatches
         from pydantic import ValidationError
 
         with pytest.raises(ValidationError):
             ServerConfig(backup_dir=None)
 
-    def test_invalid_positive_integers(self):
-        """Test validation of positive integer fields."""
-        with pytest.raises(ValueError, match="Value must be positive"):
-            ServerConfig(max_specs=0)
-
-        with pytest.raises(ValueError, match="Value must be positive"):
-            ServerConfig(max_document_size=-1)
-
-        with pytest.raises(ValueError, match="Value must be positive"):
-            ServerConfig(cache_size=0)
+    def test_log_level_case_insensitive(self):
+        """Test that log level validation is case insensitive."""
+        config = ServerConfig(log_level="debug")
+        assert config.log_level == "DEBUG"
 
 
 class TestConfigManager:
@@ -112,48 +150,36 @@ class TestConfigManager:
         manager = ConfigManager(config_path)
         assert manager.config_file == config_path
 
-    def test_load_config_defaults(self):
+    def test_load_config_defaults(self, patched_manager):
         """Test loading config with defaults only."""
-        manager = ConfigManager()
-
-        # Mock file and env loading to return empty
-        with patch.object(manager, "_load_from_file", return_value={}):
-            with patch.object(manager, "_load_from_env", return_value={}):
-                config = manager.load_config()
+        # File and env loading return empty
+        config = patched_manager({}, {}).load_config()
 
         assert isinstance(config, ServerConfig)
         assert config.host == "127.0.0.1"  # Default value
 
-    def test_load_config_from_file(self):
+    def test_load_config_from_file(self, patched_manager):
         """Test loading config from file."""
         file_config = {"host": "0.0.0.0", "port": 9000, "transport": "sse"}
 
-        manager = ConfigManager()
-
-        with patch.object(manager, "_load_from_file", return_value=file_config):
-            with patch.object(manager, "_load_from_env", return_value={}):
-                config = manager.load_config()
+        config = patched_manager(file_config, {}).load_config()
 
         assert config.host == "0.0.0.0"
         assert config.port == 9000
         assert config.transport == "sse"
 
-    def test_load_config_from_env_override(self):
+    def test_load_config_from_env_override(self, patched_manager):
         """Test that environment variables override file config."""
         file_config = {"host": "0.0.0.0", "port": 9000}
         env_config = {"host": "192.168.1.1", "transport": "sse"}
 
-        manager = ConfigManager()
-
-        with patch.object(manager, "_load_from_file", return_value=file_config):
-            with patch.object(manager, "_load_from_env", return_value=env_config):
-                config = manager.load_config()
+        config = patched_manager(file_config, env_config).load_config()
 
         assert config.host == "192.168.1.1"  # From env (overrides file)
         assert config.port == 9000  # From file
         assert config.transport == "sse"  # From env
 
-    def test_load_from_env(self):
+    def test_load_from_env(self, monkeypatch, fresh_manager):
         """Test loading configuration from environment variables."""
         env_vars = {
             "SPEC_SERVER_HOST": "test-host",
@@ -165,10 +191,11 @@ class TestConfigManager:
             "SPEC_SERVER_CACHE_SIZE": "50",
         }
 
-        manager = ConfigManager()
+        manager = fresh_manager
 
-        with patch.dict(os.environ, env_vars):
-            config_data = manager._load_from_env()
+        for name, value in env_vars.items():
+            monkeypatch.setenv(name, value)
+        config_data = manager._load_from_env()
 
         assert config_data["host"] == "test-host"
         assert config_data["port"] == 3000
@@ -178,66 +205,65 @@ class TestConfigManager:
         assert config_data["log_level"] == "debug"
         assert config_data["cache_size"] == 50
 
-    def test_parse_bool(self):
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            ("true", True),
+            ("True", True),
+            ("1", True),
+            ("yes", True),
+            ("on", True),
+            ("false", False),
+            ("False", False),
+            ("0", False),
+            ("no", False),
+            ("off", False),
+            ("", False),
+        ],
+    )
+    def test_parse_bool(self, value, expected):
         """Test boolean parsing from strings."""
-        assert ConfigManager._parse_bool("true") is True
-        assert ConfigManager._parse_bool("True") is True
-        assert ConfigManager._parse_bool("1") is True
-        assert ConfigManager._parse_bool("yes") is True
-        assert ConfigManager._parse_bool("on") is True
-
-        assert ConfigManager._parse_bool("false") is False
-        assert ConfigManager._parse_bool("False") is False
-        assert ConfigManager._parse_bool("0") is False
-        assert ConfigManager._parse_bool("no") is False
-        assert ConfigManager._parse_bool("off") is False
-        assert ConfigManager._parse_bool("") is False
-
-    def test_load_from_file_valid_json(self):
-        """Test loading from valid JSON file."""
-        config_data = {"host": "test-host", "port": 3000}
-        json_content = json.dumps(config_data)
+        assert ConfigManager._parse_bool(value) is expected
 
-        manager = ConfigManager()
+    def test_load_from_file_valid_json(self, monkeypatch, fresh_manager):
+        """Test loading from valid JSON file."""
+        manager = fresh_manager
 
-        with patch("builtins.open", mock_open(read_data=json_content)):
-            with patch.object(manager, "_find_config_file", return_value=Path("test.json")):
-                result = manager._load_from_file()
+        monkeypatch.setattr(Path, "read_text", lambda self: _VALID_CONFIG_JSON)
+        monkeypatch.setattr(manager, "_find_config_file", lambda: Path("test.json"))
+        result = manager._load_from_file()
 
-        assert result == config_data
+        assert result == _VALID_CONFIG
 
-    def test_load_from_file_invalid_json(self):
+    def test_load_from_file_invalid_json(self, monkeypatch, fresh_manager):
         """Test loading from invalid JSON file."""
         invalid_json = "{ invalid json }"
 
-        manager = ConfigManager()
+        manager = fresh_manager
 
-        with patch("builtins.open", mock_open(read_data=invalid_json)):
-            with patch.object(manager, "_find_config_file", return_value=Path("test.json")):
-                result = manager._load_from_file()
+        monkeypatch.setattr(Path, "read_text", lambda self: invalid_json)
+        monkeypatch.setattr(manager, "_find_config_file", lambda: Path("test.json"))
+        result = manager._load_from_file()
 
         assert result == {}  # Should return empty dict on error
 
-    def test_load_from_file_not_found(self):
+    def test_load_from_file_not_found(self, fresh_manager):
         """Test loading when config file is not found."""
-        manager = ConfigManager()
+        manager = fresh_manager
 
         with patch.object(manager, "_find_config_file", return_value=None):
             result = manager._load_from_file()
 
         assert result == {}
 
-    def test_find_config_file_explicit(self):
+    def test_find_config_file_explicit(self, tmp_path):
         """Test finding explicitly specified config file."""
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as tmp:
-            tmp_path = Path(tmp.name)
+        config_path = tmp_path / "config.json"
+        config_path.touch()
 
-        try:
-            manager = ConfigManager(tmp_path)
-            found_file = manager._find_config_file()
-            assert found_file == tmp_path
-        finally:
-            tmp_path.unlink()
+        manager = ConfigManager(config_path)
+        found_file = manager._find_config_file()
+        assert found_file == config_path
 
     def test_find_config_file_explicit_not_found(self):
         """Test finding explicitly specified config file that doesn't exist."""
@@ -247,33 +273,27 @@ class TestConfigManager:
         found_file = manager._find_config_file()
         assert found_file is None
 
-    def test_save_config(self):
+    def test_save_config(self, tmp_path, fresh_manager):
         """Test saving configuration to file."""
         config = ServerConfig(host="test-host", port=3000)
+        config_path = tmp_path / "config.json"
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as tmp:
-            tmp_path = Path(tmp.name)
+        manager = fresh_manager
+        manager.save_config(config, config_path)
 
-        try:
-            manager = ConfigManager()
-            manager.save_config(config, tmp_path)
+        # Verify file was written correctly
+        saved_data = json.loads(config_path.read_text())
 
-            # Verify file was written correctly
-            with open(tmp_path, "r") as f:
-                saved_data = json.load(f)
+        assert saved_data["host"] == "test-host"
+        assert saved_data["port"] == 3000
 
-            assert saved_data["host"] == "test-host"
-            assert saved_data["port"] == 3000
-        finally:
-            tmp_path.unlink()
-
-    def test_get_config_loads_if_needed(self):
+    def test_get_config_loads_if_needed(self, default_server_config, fresh_manager):
         """Test that get_config loads config if not already loaded."""
-        manager = ConfigManager()
+        manager = fresh_manager
         assert manager._config is None
 
         with patch.object(manager, "load_config") as mock_load:
-            mock_config = ServerConfig()
+            mock_config = default_server_config
             mock_load.return_value = mock_config
 
             result = manager.get_config()
@@ -281,9 +301,9 @@ class TestConfigManager:
             mock_load.assert_called_once()
             assert result == mock_config
 
-    def test_get_config_returns_cached(self):
+    def test_get_config_returns_cached(self, fresh_manager):
         """Test that get_config returns cached config if available."""
-        manager = ConfigManager()
+        manager = fresh_manager
         cached_config = ServerConfig(host="cached-host")
         manager._config = cached_config
 
@@ -293,9 +313,9 @@ class TestConfigManager:
             mock_load.assert_not_called()
             assert result == cached_config
 
-    def test_reload_config(self):
+    def test_reload_config(self, fresh_manager):
         """Test reloading configuration."""
-        manager = ConfigManager()
+        manager = fresh_manager
         old_config = ServerConfig(host="old-host")
         manager._config = old_config
 
@@ -313,12 +333,10 @@ class TestConfigManager:
 class TestConfigFunctions:
     """Test cases for module-level configuration functions."""
 
-    def test_create_example_config(self):
+    def test_create_example_config(self, example_config_parsed):
         """Test creating example configuration."""
-        example = create_example_config()
-
         # Should be valid JSON
-        data = json.loads(example)
+        data = example_config_parsed
 
         # Should contain comments and config data
         assert "_comments" in data
@@ -329,63 +347,48 @@ class TestConfigFunctions:
         assert "host" in data["_comments"]
         assert "Transport protocol" in data["_comments"]["transport"]
 
-    @patch("spec_server.config.config_manager")
-    def test_get_config(self, mock_manager):
+    def test_get_config(self, default_server_config):
         """Test global get_config function."""
-        mock_config = ServerConfig()
-        mock_manager.get_config.return_value = mock_config
+        manager = SimpleNamespace(get_config=lambda: default_server_config)
 
-        result = get_config()
+        assert get_config(manager) is default_server_config
 
-        mock_manager.get_config.assert_called_once()
-        assert result == mock_config
+    def test_get_config_uses_global_manager(self, monkeypatch, default_server_config):
+        """Test that get_config falls back to the global manager."""
+        monkeypatch.setattr(config_module, "config_manager", SimpleNamespace(get_config=lambda: default_server_config))
 
-    @patch("spec_server.config.config_manager")
-    def test_reload_config(self, mock_manager):
-        """Test global reload_config function."""
-        mock_config = ServerConfig()
-        mock_manager.reload_config.return_value = mock_config
+        assert get_config() is default_server_config
 
-        result = reload_config()
+    def test_reload_config(self, default_server_config):
+        """Test global reload_config function."""
+        manager = SimpleNamespace(reload_config=lambda: default_server_config)
 
-        mock_manager.reload_config.assert_called_once()
-        assert result == mock_config
+        assert reload_config(manager) is default_server_config
 
 
 class TestConfigIntegration:
     """Integration tests for configuration system."""
 
-    def test_full_config_loading_cycle(self):
+    def test_full_config_loading_cycle(self, tmp_path, monkeypatch):
         """Test complete configuration loading cycle."""
         # Create temporary config file
-        config_data = {
-            "host": "integration-host",
-            "port": 4000,
-            "transport": "sse",
-            "specs_dir": "integration-specs",
+        config_path = tmp_path / "config.json"
+        config_path.write_bytes(_INTEGRATION_CONFIG_JSON)
+
+        # Set some environment variables
+        env_vars = {
+            "SPEC_SERVER_PORT": "5000",  # Should override file
+            "SPEC_SERVER_LOG_LEVEL": "DEBUG",  # Should add to config
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as tmp:
-            json.dump(config_data, tmp)
-            tmp_path = Path(tmp.name)
-
-        try:
-            # Set some environment variables
-            env_vars = {
-                "SPEC_SERVER_PORT": "5000",  # Should override file
-                "SPEC_SERVER_LOG_LEVEL": "DEBUG",  # Should add to config
-            }
-
-            with patch.dict(os.environ, env_vars):
-                manager = ConfigManager(tmp_path)
-                config = manager.load_config()
-
-            # Verify configuration
-            assert config.host == "integration-host"  # From file
-            assert config.port == 5000  # From env (overrides file)
-            assert config.transport == "sse"  # From file
-            assert config.specs_dir == "integration-specs"  # From file
-            assert config.log_level == "DEBUG"  # From env
-
-        finally:
-            tmp_path.unlink()
+        for name, value in env_vars.items():
+            monkeypatch.setenv(name, value)
+        manager = ConfigManager(config_path)
+        config = manager.load_config()
+
+        # Verify configuration
+        assert config.host == "integration-host"  # From file
+        assert config.port == 5000  # From env (overrides file)
+        assert config.transport == "sse"  # From file
+        assert config.specs_dir == "integration-specs"  # From file
+        assert config.log_level == "DEBUG"  # From env
@@ -1,15 +1,20 @@
 """Tests for ContentClassifier component."""
 
+import pytest
+
 from src.spec_server.content_classifier import ContentClassifier
 
 
+@pytest.fixture(scope="class")
+def _shared_classifier(request):
+    """Share one ContentClassifier across the tests of a class."""
+    request.cls.classifier = ContentClassifier()
+
+
+@pytest.mark.usefixtures("_shared_classifier")
 class TestContentClassifier:
     """Test cases for ContentClassifier functionality."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.classifier = ContentClassifier()
-
     def test_classify_task_content(self):
         """Test classification of task-related content."""
         content = """
@@ -200,3 +205,27 @@ Some regular content here.
 
         if neutral_block:
             assert neutral_block.suggested_location == "tasks"
+
+    def test_cached_classification_follows_keyword_changes(self):
+        """Test that cached results are not reused after the keyword lists change."""
+        content = "We deploy the service nightly."
+        blocks = self.classifier.classify_content_blocks(content)
+        assert blocks[0].content_type == "task"
+
+        classifier = ContentClassifier()
+        classifier.task_keywords = []
+        classifier.design_keywords = ["deploy"]
+
+        blocks = classifier.classify_content_blocks(content)
+        assert blocks[0].content_type == "design"
+
+    def test_keyword_assignment_refreshes_cached_classification(self):
+        """Test that assigning keywords on a classifier stops it reusing its cached results."""
+        content = "We deploy the service nightly."
+        classifier = ContentClassifier()
+        assert classifier.classify_content_blocks(content)[0].content_type == "task"
+
+        classifier.task_keywords = []
+        classifier.design_keywords = ["deploy"]
+
+        assert classifier.classify_content_blocks(content)[0].content_type == "design"
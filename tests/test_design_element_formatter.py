@@ -4,17 +4,23 @@ Unit tests for DesignElementFormatter.
 Tests the design element formatting functionality.
 """
 
+import pytest
+
 from src.spec_server.design_element_formatter import DesignElementFormatter, DesignElementFormattingError
 from src.spec_server.models import DesignElementTemplate, EnhancedDesignTemplate, TechnicalElement
+from tests.utils.test_helpers import assert_contains_in_order
+
+
+@pytest.fixture(scope="class")
+def _shared_formatter(request):
+    """Share one DesignElementFormatter across the tests of a class."""
+    request.cls.formatter = DesignElementFormatter()
 
 
+@pytest.mark.usefixtures("_shared_formatter")
 class TestDesignElementFormatter:
     """Test DesignElementFormatter class."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.formatter = DesignElementFormatter()
-
     def test_initialization(self):
         """Test DesignElementFormatter initialization."""
         assert self.formatter.template is not None
@@ -48,9 +54,7 @@ This interface handles user operations and provides user management functionalit
 
         formatted = self.formatter.format_element(element)
 
-        assert "**Intent**:" in formatted
-        assert "**Goals**:" in formatted
-        assert "**Logic**:" in formatted
+        assert_contains_in_order(formatted, "**Intent**:", "**Goals**:", "**Logic**:")
         assert "UserService" in formatted
         assert "### UserService Interface" in formatted
 
@@ -70,9 +74,7 @@ This component handles task lifecycle and provides task management capabilities.
 
         formatted = self.formatter.format_element(element)
 
-        assert "**Intent**: Manages task operations in the system." in formatted
-        assert "**Goals**:" in formatted
-        assert "**Logic**:" in formatted
+        assert_contains_in_order(formatted, "**Intent**: Manages task operations in the system.", "**Goals**:", "**Logic**:")
         assert "task lifecycle" in formatted  # Should preserve existing content
 
     def test_format_element_with_all_sections_present(self):
@@ -98,10 +100,7 @@ This component handles task lifecycle and provides task management capabilities.
 
         formatted = self.formatter.format_element(element)
 
-        assert "**Intent**: Represents user data in the system." in formatted
-        assert "- Store user information" in formatted
-        assert "- Validate user data" in formatted
-        assert "**Logic**: The model uses validation rules" in formatted
+        assert_contains_in_order(formatted, "**Intent**: Represents user data in the system.", "- Store user information", "- Validate user data", "**Logic**: The model uses validation rules")
 
     def test_generate_intent_section(self):
         """Test generating Intent section content."""
@@ -133,11 +132,17 @@ This component handles task lifecycle and provides task management capabilities.
 
         formatted = self.formatter.format_element(element)
 
-        assert "**Intent**:" in formatted
-        assert "**Goals**:" in formatted
-        assert "**Logic**:" in formatted
+        assert_contains_in_order(formatted, "**Intent**:", "**Goals**:", "**Logic**:")
         assert "EmailService" in formatted
 
+    def test_fallback_template_for_unknown_type(self):
+        """Test that element types without a template share one generated fallback."""
+        template = self.formatter._get_element_template("service")
+
+        assert template.element_type == "service"
+        assert "service" in template.intent_template
+        assert self.formatter._get_element_template("service") is template
+
     def test_extract_existing_sections_with_intent(self):
         """Test extracting existing Intent section."""
         content = """### Component
@@ -285,6 +290,23 @@ It includes multiple lines and should remain intact."""
         assert "**Goals**:" not in remaining
         assert "**Logic**:" not in remaining
 
+    def test_extract_remaining_content_keeps_text_under_later_headers(self):
+        """Test that a section ending at a sub-header does not swallow the text below it."""
+        original_content = "### Component\n**Intent**: Component purpose.\n#### Notes\nKeep this note."
+
+        remaining = self.formatter._extract_remaining_content(original_content, {})
+
+        assert remaining == "Keep this note."
+
+    def test_extract_remaining_content_keeps_text_after_label_in_header(self):
+        """Test that a bold label inside a header line does not swallow later text."""
+        remaining = self.formatter._extract_remaining_content("# T**Logic**: y\ntext", {})
+        assert remaining == "text"
+
+        original_content = "# T**Logic**: y\nKeep this.\n**Intent**: Drop this."
+        remaining = self.formatter._extract_remaining_content(original_content, {})
+        assert remaining == "Keep this."
+
     def test_format_element_preserves_header_format(self):
         """Test that formatting preserves the original header format."""
         element = TechnicalElement(element_type="interface", element_name="TestInterface", content="#### TestInterface API\n\nInterface description here.", line_start=1, line_end=3)
@@ -320,9 +342,11 @@ It includes multiple lines and should remain intact."""
             format_templates={"service": DesignElementTemplate(element_type="service", intent_template="New intent template", goals_template="- New goal", logic_template="New logic template")}
         )
 
-        self.formatter.update_template(new_template)
-        assert self.formatter.template == new_template
-        assert "service" in self.formatter.get_supported_element_types()
+        # Use a separate formatter so the shared one keeps the default template
+        formatter = DesignElementFormatter()
+        formatter.update_template(new_template)
+        assert formatter.template == new_template
+        assert "service" in formatter.get_supported_element_types()
 
     def test_get_supported_element_types(self):
         """Test getting supported element types."""
@@ -355,9 +379,7 @@ It includes multiple lines and should remain intact."""
 
         formatted = formatter.format_element(element)
 
-        assert "**Purpose**:" in formatted
-        assert "**Objectives**:" in formatted
-        assert "**Implementation**:" in formatted
+        assert_contains_in_order(formatted, "**Purpose**:", "**Objectives**:", "**Implementation**:")
         assert "**Intent**:" not in formatted
         assert "**Goals**:" not in formatted
         assert "**Logic**:" not in formatted
@@ -4,17 +4,22 @@ Unit tests for DesignFormatDetector.
 Tests the design format detection and analysis functionality.
 """
 
+import pytest
+
 from src.spec_server.design_format_detector import DesignFormatDetector
 from src.spec_server.models import EnhancedDesignTemplate, FormatAnalysisResult, TechnicalElement
 
 
+@pytest.fixture(scope="class")
+def _shared_detector(request):
+    """Share one DesignFormatDetector across the tests of a class."""
+    request.cls.detector = DesignFormatDetector()
+
+
+@pytest.mark.usefixtures("_shared_detector")
 class TestDesignFormatDetector:
     """Test DesignFormatDetector class."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.detector = DesignFormatDetector()
-
     def test_initialization(self):
         """Test DesignFormatDetector initialization."""
         assert self.detector.template is not None
@@ -340,9 +345,10 @@ class TestDesignFormatDetector:
         """Test updating the detector template."""
         new_template = EnhancedDesignTemplate(element_patterns={"custom_type": r"custom\s+(\w+)"})
 
-        self.detector.update_template(new_template)
-        assert self.detector.template == new_template
-        assert "custom_type" in self.detector.get_supported_element_types()
+        detector = DesignFormatDetector()
+        detector.update_template(new_template)
+        assert detector.template == new_template
+        assert "custom_type" in detector.get_supported_element_types()
 
     def test_find_element_end_line(self):
         """Test finding element end line."""
@@ -5,11 +5,12 @@ These tests show how to use the various fixtures and utilities provided
 for testing spec-server functionality.
 """
 
+import asyncio
 from pathlib import Path
 
 import pytest
 
-from tests.fixtures import MockFileSystem, SpecTestData, SpecTestFixtures
+from tests.fixtures import MockFileSystem, SpecTemplateCache, SpecTestData, SpecTestFixtures
 
 
 class TestSpecTestData:
@@ -32,6 +33,11 @@ class TestSpecTestData:
         unknown_idea = SpecTestData.get_feature_idea("unknown-feature")
         assert "unknown-feature" in unknown_idea
 
+    def test_iter_feature_names(self):
+        """Test iterating over a bounded number of feature names."""
+        assert list(SpecTestData.iter_feature_names(3)) == list(SpecTestData.get_all_feature_names()[:3])
+        assert list(SpecTestData.iter_feature_names()) == list(SpecTestData.get_all_feature_names())
+
     def test_sample_documents(self):
         """Test that sample documents are properly formatted."""
         # Test requirements document
@@ -92,6 +98,18 @@ class TestSpecTestFixtures:
 
         fixtures.cleanup()
 
+    def test_acreate_multiple_specs(self, temp_spec_dir):
+        """Test creating multiple specifications from async code."""
+        fixtures = SpecTestFixtures(base_path=temp_spec_dir)
+
+        results = asyncio.run(fixtures.acreate_multiple_specs(count=2))
+
+        assert len(results) == 2
+        assert all(result["success"] for result in results)
+        assert len(fixtures.created_specs) == 2
+
+        fixtures.cleanup()
+
     def test_create_spec_with_file_references(self, temp_spec_dir):
         """Test creating a spec with file references."""
         fixtures = SpecTestFixtures(base_path=temp_spec_dir)
@@ -127,6 +145,49 @@ class TestSpecTestFixtures:
         # Verify specs were deleted (directory should be cleaned up)
         # Note: The temp directory itself might still exist but should be empty or cleaned
 
+    def test_fixtures_cleanup_removes_owned_directory(self):
+        """Test that cleanup removes a temporary directory the fixtures created themselves."""
+        fixtures = SpecTestFixtures()
+        fixtures.create_sample_spec("cleanup-test")
+
+        fixtures.cleanup()
+
+        assert not fixtures.base_path.exists()
+        assert fixtures.created_specs == []
+
+    def test_fixtures_cleanup_keeps_supplied_directory(self, temp_spec_dir):
+        """Test that cleanup only deletes created specs from a caller-supplied directory."""
+        fixtures = SpecTestFixtures(base_path=temp_spec_dir)
+        fixtures.create_sample_spec("cleanup-test")
+
+        fixtures.cleanup()
+
+        assert temp_spec_dir.exists()
+        assert not (temp_spec_dir / "cleanup-test").exists()
+
+    def test_create_sample_spec_from_template_cache(self, tmp_path):
+        """Test that specs copied from the template cache match specs built from scratch."""
+        cache = SpecTemplateCache(tmp_path / "templates")
+        first = SpecTestFixtures(base_path=tmp_path / "first", template_cache=cache)
+        second = SpecTestFixtures(base_path=tmp_path / "second", template_cache=cache)
+
+        first.create_sample_spec("user-auth", phase="tasks")
+        result = second.create_sample_spec("user-auth", phase="tasks")
+
+        assert result["success"] is True
+        assert result["spec"]["base_path"] == str(tmp_path / "second" / "user-auth")
+        assert "user-auth" in second.created_specs
+        assert (tmp_path / "second" / "user-auth" / "design.md").exists()
+
+        spec = second.mcp_tools.spec_manager.get_spec("user-auth")
+        assert second.mcp_tools.workflow_engine.get_current_phase(spec).value == "tasks"
+        assert second.mcp_tools.workflow_engine.approval_tracking == first.mcp_tools.workflow_engine.approval_tracking
+        for file_name in ("requirements.md", "design.md", "tasks.md"):
+            assert (tmp_path / "second" / "user-auth" / file_name).read_text() == (tmp_path / "first" / "user-auth" / file_name).read_text()
+
+        first.cleanup()
+        second.cleanup()
+
 
 class TestMockFileSystem:
     """Test the MockFileSystem utility class."""
@@ -173,6 +234,15 @@ class TestMockFileSystem:
         assert "file2.txt" in files
         assert "dir/file3.txt" in files
 
+    def test_create_file_tracks_parent_directory(self):
+        """Test that creating a nested file records its parent directory."""
+        mock_fs = MockFileSystem()
+
+        mock_fs.create_file("top.txt", "Content")
+        mock_fs.create_file("specs/feature/requirements.md", "Content")
+
+        assert mock_fs.directories == {"specs/feature"}
+
     def test_clear_filesystem(self):
         """Test clearing the mock file system."""
         mock_fs = MockFileSystem()
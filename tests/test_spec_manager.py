@@ -304,6 +304,33 @@ class TestSpecManager:
 
         assert exc_info.value.error_code == "SPEC_NOT_FOUND"
 
+    def test_update_specs_metadata(self, temp_specs_dir):
+        """Test updating metadata for several specs at once."""
+        manager = SpecManager(temp_specs_dir)
+        manager.create_spec("feature-one", "First feature")
+        manager.create_spec("feature-two", "Second feature")
+
+        manager.update_specs_metadata({"feature-one": {"field": "one"}, "feature-two": {"field": "two"}})
+
+        with open(temp_specs_dir / ".spec-metadata.json", "r") as f:
+            registry = json.load(f)
+
+        assert registry["feature-one"]["field"] == "one"
+        assert registry["feature-two"]["field"] == "two"
+
+    def test_update_specs_metadata_not_found_writes_nothing(self, temp_specs_dir):
+        """Test that no metadata is written when any spec in the batch is missing."""
+        manager = SpecManager(temp_specs_dir)
+        manager.create_spec("feature-one", "First feature")
+
+        with pytest.raises(SpecError) as exc_info:
+            manager.update_specs_metadata({"feature-one": {"field": "one"}, "nonexistent": {"field": "two"}})
+
+        assert exc_info.value.error_code == "SPEC_NOT_FOUND"
+        with open(temp_specs_dir / ".spec-metadata.json", "r") as f:
+            registry = json.load(f)
+        assert "field" not in registry["feature-one"]
+
     def test_spec_exists(self, temp_specs_dir):
         """Test checking if spec exists."""
         manager = SpecManager(temp_specs_dir)
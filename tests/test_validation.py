@@ -69,6 +69,20 @@ class TestInputValidator:
         assert len(result.warnings) > 0
         assert "reserved name" in result.warnings[0]
 
+    def test_validate_feature_name_cached(self):
+        """Test that repeated feature names reuse the cached result."""
+        first = InputValidator.validate_feature_name("cached-feature")
+        second = InputValidator.validate_feature_name("cached-feature")
+
+        assert first is second
+        assert first.sanitized_value == "cached-feature"
+
+    def test_validate_feature_name_unhashable(self):
+        """Test that non-string feature names are rejected rather than cached."""
+        result = InputValidator.validate_feature_name(["user-auth"])
+        assert not result.is_valid
+        assert "must be a string" in result.errors[0]
+
     def test_validate_document_type_valid(self):
         """Test validating valid document types."""
         valid_types = ["requirements", "design", "tasks"]
@@ -114,6 +128,12 @@ class TestInputValidator:
         assert "\r\n" not in result.sanitized_value
         assert result.sanitized_value == "Line 1\nLine 2\nLine 3"
 
+    def test_validate_document_content_mixed_line_endings(self):
+        """Test that lone CR and CRLF line endings are both normalized."""
+        result = InputValidator.validate_document_content("Line 1\rLine 2\r\nLine 3\n")
+        assert result.is_valid
+        assert result.sanitized_value == "Line 1\nLine 2\nLine 3\n"
+
     def test_validate_document_content_too_large(self):
         """Test document content that's too large."""
         large_content = "A" * (InputValidator.MAX_DOCUMENT_CONTENT_LENGTH + 1)
@@ -135,6 +155,16 @@ class TestInputValidator:
             assert result.is_valid  # Still valid but with warnings
             assert len(result.warnings) > 0
 
+    def test_validate_document_content_dangerous_patterns_case_insensitive(self):
+        """Test that dangerous patterns are detected regardless of case, each reported once."""
+        result = InputValidator.validate_document_content('<SCRIPT src="JavaScript:run()">')
+
+        assert result.is_valid
+        assert result.warnings == [
+            "Content contains potentially dangerous pattern: <script[^>]*>",
+            "Content contains potentially dangerous pattern: javascript:",
+        ]
+
     def test_validate_initial_idea_valid(self):
         """Test validating valid initial ideas."""
         valid_ideas = [
@@ -222,6 +252,16 @@ class TestInputValidator:
             result = InputValidator.validate_file_path(path)
             assert not result.is_valid
 
+    def test_validate_file_path_reports_each_dangerous_pattern(self):
+        """Test that every matched dangerous pattern is reported once, in pattern order."""
+        result = InputValidator.validate_file_path("a;b;c | d", allow_absolute=True)
+
+        assert not result.is_valid
+        assert result.errors == [
+            "File path contains dangerous pattern: ;",
+            "File path contains dangerous pattern: \\|",
+        ]
+
     def test_validate_file_path_suspicious_extensions(self):
         """Test warning for suspicious file extensions."""
         suspicious_files = ["script.exe", "batch.bat", "shell.sh", "powershell.ps1"]
@@ -233,8 +273,8 @@ class TestInputValidator:
 
     def test_validate_boolean_valid(self):
         """Test validating boolean values."""
-        true_values = [True, "true", "1", "yes", "on", 1, 1.0]
-        false_values = [False, "false", "0", "no", "off", "", 0, 0.0, None]
+        true_values = [True, "true", "1", "yes", "on", " Yes ", "TRUE", 1, 1.0]
+        false_values = [False, "false", "0", "no", "off", "", "OFF", "  ", 0, 0.0, None]
 
         for value in true_values:
             result = InputValidator.validate_boolean(value, "test_field")
@@ -254,6 +294,11 @@ class TestInputValidator:
             result = InputValidator.validate_boolean(value, "test_field")
             assert not result.is_valid
 
+    def test_boolean_strings_is_read_only(self):
+        """Test that the accepted boolean strings cannot be modified."""
+        with pytest.raises(TypeError):
+            InputValidator.BOOLEAN_STRINGS["maybe"] = True  # type: ignore[index]
+
 
 class TestValidationFunctions:
     """Test cases for validation helper functions."""
@@ -344,4 +389,22 @@ class TestValidationResult:
         assert result.is_valid is False
         assert result.sanitized_value is None
         assert result.errors == ["error1", "error2"]
-        assert result.warnings == []
+        assert result.warnings == ()
+
+    def test_model_dump(self):
+        """Test dumping a ValidationResult to a dictionary."""
+        result = ValidationResult(is_valid=False, errors=("error1",))
+
+        assert result.model_dump() == {
+            "is_valid": False,
+            "sanitized_value": None,
+            "errors": ["error1"],
+            "warnings": [],
+        }
+
+    def test_result_is_immutable(self):
+        """Test that ValidationResult instances cannot be modified after creation."""
+        result = ValidationResult(is_valid=True, sanitized_value="test-value")
+
+        with pytest.raises(AttributeError):
+            result.is_valid = False
@@ -2,7 +2,11 @@
 Unit tests for WorkflowEngine class.
 """
 
+import os
+import shutil
+import time
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -72,6 +76,61 @@ class TestWorkflowEngine:
         current_phase = engine.get_current_phase(spec)
         assert current_phase == Phase.TASKS
 
+    def test_get_current_phase_sees_files_added_after_caching(self, temp_specs_dir):
+        """Test that a cached directory listing is invalidated when a phase file is added."""
+        spec_manager = SpecManager(temp_specs_dir)
+        engine = WorkflowEngine(spec_manager)
+
+        spec = spec_manager.create_spec("test-feature", "Test feature")
+        spec.get_requirements_path().write_text("# Requirements")
+        an_hour_ago = time.time() - 3600
+        os.utime(spec.base_path, (an_hour_ago, an_hour_ago))
+
+        assert engine.get_current_phase(spec) == Phase.REQUIREMENTS
+        assert str(spec.base_path) in engine._listing_cache
+
+        spec.get_design_path().write_text("# Design")
+        assert engine.get_current_phase(spec) == Phase.DESIGN
+
+    def test_get_current_phase_sees_directory_replaced_with_same_mtime(self, temp_specs_dir):
+        """Test that a cached listing is invalidated when the directory is replaced by a copy."""
+        spec_manager = SpecManager(temp_specs_dir)
+        engine = WorkflowEngine(spec_manager)
+
+        spec = spec_manager.create_spec("test-feature", "Test feature")
+        spec.get_requirements_path().write_text("# Requirements")
+        an_hour_ago = time.time() - 3600
+        os.utime(spec.base_path, (an_hour_ago, an_hour_ago))
+        assert engine.get_current_phase(spec) == Phase.REQUIREMENTS
+
+        # Build the replacement while the original still exists so it gets a new inode
+        replacement = spec.base_path.with_name("replacement")
+        shutil.copytree(spec.base_path, replacement)
+        (replacement / "design.md").write_text("# Design")
+        shutil.copystat(spec.base_path, replacement)
+        shutil.rmtree(spec.base_path)
+        replacement.rename(spec.base_path)
+
+        assert engine.get_current_phase(spec) == Phase.DESIGN
+
+    def test_listing_cache_is_bounded(self, temp_specs_dir):
+        """Test that the directory listing cache evicts its oldest entry when full."""
+        spec_manager = SpecManager(temp_specs_dir)
+        engine = WorkflowEngine(spec_manager)
+
+        an_hour_ago = time.time() - 3600
+        specs = []
+        for name in ("feature-a", "feature-b", "feature-c"):
+            spec = spec_manager.create_spec(name, "Test feature")
+            os.utime(spec.base_path, (an_hour_ago, an_hour_ago))
+            specs.append(spec)
+
+        with patch("spec_server.workflow_engine._LISTING_CACHE_SIZE", 2):
+            for spec in specs:
+                engine.get_current_phase(spec)
+
+        assert list(engine._listing_cache) == [str(specs[1].base_path), str(specs[2].base_path)]
+
     def test_can_advance_phase_without_approval(self, temp_specs_dir):
         """Test checking if phase can advance without approval."""
         spec_manager = SpecManager(temp_specs_dir)
@@ -114,6 +173,16 @@ class TestWorkflowEngine:
         can_advance = engine.can_advance_phase(spec, approval=True)
         assert can_advance is False
 
+    def test_can_advance_phase_with_precomputed_phase(self, temp_specs_dir):
+        """Test that a precomputed current phase is used instead of re-reading the disk."""
+        spec_manager = SpecManager(temp_specs_dir)
+        engine = WorkflowEngine(spec_manager)
+
+        spec = spec_manager.create_spec("test-feature", "Test feature")
+
+        assert engine.can_advance_phase(spec, approval=True, current_phase=Phase.COMPLETE) is False
+        assert engine.can_advance_phase(spec, approval=True, current_phase=Phase.REQUIREMENTS) is True
+
     def test_advance_phase_success(self, temp_specs_dir):
         """Test successful phase advancement."""
         spec_manager = SpecManager(temp_specs_dir)
@@ -129,6 +198,23 @@ class TestWorkflowEngine:
         # Check approval was recorded
         assert engine._is_phase_approved("test-feature", "requirements")
 
+    def test_advance_phase_deferred_metadata(self, temp_specs_dir):
+        """Test that deferred advancements only reach the metadata registry on flush."""
+        spec_manager = SpecManager(temp_specs_dir)
+        engine = WorkflowEngine(spec_manager)
+
+        spec = spec_manager.create_spec("test-feature", "Test feature")
+        spec.get_requirements_path().write_text("# Requirements")
+
+        assert engine.advance_phase(spec, approval=True, defer=True) == Phase.DESIGN
+        assert spec_manager._load_metadata_registry()["test-feature"]["current_phase"] == "requirements"
+
+        engine.flush_metadata()
+
+        metadata = spec_manager._load_metadata_registry()["test-feature"]
+        assert metadata["current_phase"] == "design"
+        assert "last_phase_advancement" in metadata
+
     def test_advance_phase_without_approval(self, temp_specs_dir):
         """Test phase advancement without approval fails."""
         spec_manager = SpecManager(temp_specs_dir)
@@ -259,6 +345,23 @@ class TestWorkflowEngine:
         assert status["phase_files"]["design"] is False
         assert status["phase_files"]["tasks"] is False
 
+    def test_get_phase_status_lists_directory_once(self, temp_specs_dir):
+        """Test that a status query reads the spec directory a single time."""
+        spec_manager = SpecManager(temp_specs_dir)
+        engine = WorkflowEngine(spec_manager)
+
+        spec = spec_manager.create_spec("test-feature", "Test feature")
+        spec.get_requirements_path().write_text("# Requirements")
+        spec.get_design_path().write_text("# Design")
+        engine._record_phase_approval("test-feature", "design")
+
+        with patch.object(engine, "_existing_phase_files", wraps=engine._existing_phase_files) as listing:
+            status = engine.get_phase_status(spec)
+
+        assert listing.call_count == 1
+        assert status["current_phase"] == "tasks"
+        assert status["can_advance"] is False  # Tasks phase not approved yet
+
     def test_reset_phase_approvals(self, temp_specs_dir):
         """Test resetting phase approvals."""
         spec_manager = SpecManager(temp_specs_dir)
@@ -393,6 +496,25 @@ class TestWorkflowEngine:
         assert approvals["requirements"] is True
         assert approvals["design"] is True
 
+    def test_approval_tracking_property(self, temp_specs_dir):
+        """Test that approval_tracking exposes approvals keyed by feature and phase."""
+        spec_manager = SpecManager(temp_specs_dir)
+        engine = WorkflowEngine(spec_manager)
+
+        assert engine.approval_tracking == {}
+
+        engine._record_phase_approval("feature-a", "requirements")
+        engine._record_phase_approval("feature-a", "design")
+        engine._record_phase_approval("feature-b", "requirements")
+
+        assert engine.approval_tracking == {
+            "feature-a": {"requirements": True, "design": True},
+            "feature-b": {"requirements": True},
+        }
+
+        engine.reset_phase_approvals("feature-a")
+        assert engine.approval_tracking == {"feature-b": {"requirements": True}}
+
     def test_workflow_error_handling(self, temp_specs_dir):
         """Test workflow error handling."""
         spec_manager = SpecManager(temp_specs_dir)
@@ -183,6 +183,15 @@ def assert_task_structure(task: Task):
     ]
 
 
+def assert_contains_in_order(text: str, *markers: str):
+    """Assert that text contains each marker, in the given order, in a single forward scan."""
+    position = 0
+    for marker in markers:
+        found = text.find(marker, position)
+        assert found >= 0, f"{marker!r} not found in order in:\n{text}"
+        position = found + len(marker)
+
+
 def create_sample_file_references(temp_dir: Path) -> Dict[str, Path]:
     """Create sample files for testing file references."""
     files = {}